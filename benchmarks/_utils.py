@@ -0,0 +1,55 @@
+"""基准测试的公共工具"""
+import json
+import os
+import sys
+import time
+import typing as t
+
+ROOT = os.path.realpath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def setup_django():
+    """使用 tests/ 的 Django 配置初始化环境。"""
+    for path in (ROOT, os.path.join(ROOT, "src"), os.path.join(ROOT, "docs")):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+    import django
+
+    django.setup()
+
+
+def timeit(fn: t.Callable[[], t.Any], *, number: int = 1, repeat: int = 5) -> float:
+    """返回 ``repeat`` 次测量中的最短单次耗时（秒）。"""
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        results.append((time.perf_counter() - start) / number)
+    return min(results)
+
+
+def peak_rss_kb() -> t.Optional[int]:
+    """进程的峰值常驻内存（KiB），不支持的平台返回 `None`。"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        rss //= 1024
+    return rss
+
+
+def report(name: str, results: t.Dict[str, t.Any], as_json: bool = False):
+    if as_json:
+        print(json.dumps({"benchmark": name, **results}, sort_keys=True))
+        return
+    print(name)
+    width = max(len(k) for k in results)
+    for key, value in results.items():
+        if isinstance(value, float):
+            value = "%.6f" % value
+        print(f"  {key:<{width}}  {value}")
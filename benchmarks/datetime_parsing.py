@@ -0,0 +1,58 @@
+"""
+日期时间解析基准测试。
+
+使用典型的 RFC 3339 字符串，测量 ``Datetime().deserialize`` 的耗时，并与直接使用 ``dateutil.parser.isoparse`` 对比::
+
+    python benchmarks/datetime_parsing.py --items 10000
+    python benchmarks/datetime_parsing.py --items 10000 --json >> bench_output.txt
+"""
+import argparse
+import datetime
+
+from _utils import report, setup_django, timeit
+
+FORMATS = {
+    "utc": "%Y-%m-%dT%H:%M:%SZ",
+    "offset": "%Y-%m-%dT%H:%M:%S+08:00",
+    "fraction": "%Y-%m-%dT%H:%M:%S.%f+08:00",
+    "naive": "%Y-%m-%d %H:%M:%S",
+}
+
+
+def make_payload(items: int, fmt: str) -> list:
+    start = datetime.datetime(2024, 1, 1, 8, 30, 15, 123456)
+    return [(start + datetime.timedelta(minutes=i)).strftime(fmt) for i in range(items)]
+
+
+def main(items: int, number: int, as_json: bool):
+    setup_django()
+
+    from dateutil.parser import isoparse
+
+    from django_oasis import schema
+
+    datetime_schema = schema.List(schema.Datetime(with_tz=None))
+    for name, fmt in FORMATS.items():
+        payload = make_payload(items, fmt)
+        report(
+            f"datetime_parsing.{name}",
+            {
+                "items": items,
+                "deserialize_time": timeit(
+                    lambda: datetime_schema.deserialize(payload), number=number
+                ),
+                "isoparse_time": timeit(
+                    lambda: [isoparse(value) for value in payload], number=number
+                ),
+            },
+            as_json,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="测量日期时间字符串的解析耗时")
+    parser.add_argument("--items", type=int, default=10000, help="列表元素数量")
+    parser.add_argument("--number", type=int, default=5, help="每次测量的调用次数")
+    parser.add_argument("--json", action="store_true", help="以 JSON 行格式输出")
+    args = parser.parse_args()
+    main(args.items, args.number, args.json)
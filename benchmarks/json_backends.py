@@ -0,0 +1,61 @@
+"""
+JSON 后端基准测试。
+
+分别使用各个已安装的 JSON 后端，测量序列化后的列表响应数据的编码耗时，以及同等大小请求体的解码耗时::
+
+    python benchmarks/json_backends.py --items 1000
+    python benchmarks/json_backends.py --items 1000 --json >> bench_output.txt
+"""
+import argparse
+import datetime
+import decimal
+
+from _utils import report, setup_django, timeit
+
+
+def make_payload(items: int) -> list:
+    return [
+        {
+            "id": i,
+            "title": "三体 %d" % i,
+            "author": "刘慈欣",
+            "price": decimal.Decimal("23.50"),
+            "published": datetime.date(2008, 1, 1),
+            "tags": ["科幻", "小说"],
+            "rating": 9.3,
+            "available": i % 2 == 0,
+        }
+        for i in range(items)
+    ]
+
+
+def main(items: int, number: int, as_json: bool):
+    setup_django()
+
+    from django_oasis.json_backends import _BUILTIN_BACKENDS
+
+    payload = make_payload(items)
+    for name, backend_class in _BUILTIN_BACKENDS.items():
+        if not backend_class.is_available():
+            continue
+        backend = backend_class()
+        body = backend.dumps(payload)
+        report(
+            f"json_backends.{name}",
+            {
+                "items": items,
+                "dumps_time": timeit(lambda: backend.dumps(payload), number=number),
+                "loads_time": timeit(lambda: backend.loads(body), number=number),
+                "body_bytes": len(body),
+            },
+            as_json,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="比较各个 JSON 后端的编码/解码耗时")
+    parser.add_argument("--items", type=int, default=1000, help="列表元素数量")
+    parser.add_argument("--number", type=int, default=20, help="每次测量的调用次数")
+    parser.add_argument("--json", action="store_true", help="以 JSON 行格式输出")
+    args = parser.parse_args()
+    main(args.items, args.number, args.json)
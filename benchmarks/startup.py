@@ -0,0 +1,122 @@
+"""
+启动开销基准测试。
+
+合成包含 N 个 Resource（及对应的 Django Model、Operation）的模块，
+分别测量模块导入、``OpenAPI.add_resources`` 和首次 ``OpenAPI.get_spec`` 的耗时，以及进程峰值内存。
+
+每次测量都需要全新的进程，因此每个进程只运行一次::
+
+    python benchmarks/startup.py --resources 600
+    python benchmarks/startup.py --resources 600 --json >> bench_output.txt
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import time
+
+from _utils import peak_rss_kb, report, setup_django
+
+MODULE_HEADER = """\
+from django.db import models
+
+from django_oasis import schema
+from django_oasis.common import model2schema
+from django_oasis.core import Operation, Resource
+from django_oasis.parameter import JsonData, Query
+"""
+
+RESOURCE_TEMPLATE = """
+
+class Model{i}(models.Model):
+{fields}
+
+    class Meta:
+        app_label = "tests"
+
+
+Schema{i} = model2schema(Model{i})
+
+
+@Resource("/items{i}/{{pk}}", param_schemas={{"pk": schema.Integer()}})
+class Resource{i}:
+    @Operation(summary="get item {i}", response_schema=Schema{i})
+    def get(self, query=Query({{"q": schema.String(required=False)}})):
+        ...
+
+    @Operation(summary="update item {i}", response_schema=Schema{i})
+    def put(self, body=JsonData(Schema{i})):
+        ...
+
+    def delete(self):
+        ...
+"""
+
+FIELD_TEMPLATES = [
+    "    char{j} = models.CharField(max_length=32, blank=True)",
+    "    int{j} = models.IntegerField(default=0)",
+    "    datetime{j} = models.DateTimeField(null=True)",
+    "    bool{j} = models.BooleanField(default=False)",
+]
+
+
+def generate_module(resources: int, fields: int) -> str:
+    fields_source = "\n".join(
+        FIELD_TEMPLATES[j % len(FIELD_TEMPLATES)].format(j=j) for j in range(fields)
+    )
+    return MODULE_HEADER + "".join(
+        RESOURCE_TEMPLATE.format(i=i, fields=fields_source) for i in range(resources)
+    )
+
+
+def main(resources: int, fields: int, as_json: bool):
+    setup_django()
+
+    from django_oasis.core import OpenAPI
+
+    with tempfile.TemporaryDirectory() as dirname:
+        module_name = "oasis_bench_resources"
+        with open(os.path.join(dirname, module_name + ".py"), "w") as fp:
+            fp.write(generate_module(resources, fields))
+        sys.path.insert(0, dirname)
+
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        import_time = time.perf_counter() - start
+
+    openapi = OpenAPI()
+    start = time.perf_counter()
+    openapi.add_resources(module)
+    add_resources_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    openapi.get_spec()
+    first_get_spec_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    openapi.get_spec()
+    second_get_spec_time = time.perf_counter() - start
+
+    report(
+        "startup",
+        {
+            "resources": resources,
+            "fields": fields,
+            "import_time": import_time,
+            "add_resources_time": add_resources_time,
+            "first_get_spec_time": first_get_spec_time,
+            "second_get_spec_time": second_get_spec_time,
+            "peak_rss_kb": peak_rss_kb(),
+        },
+        as_json,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="测量大量 Resource 时的启动开销")
+    parser.add_argument("--resources", type=int, default=600, help="Resource 数量")
+    parser.add_argument("--fields", type=int, default=8, help="每个 Model 的字段数量")
+    parser.add_argument("--json", action="store_true", help="以 JSON 行格式输出")
+    args = parser.parse_args()
+    main(args.resources, args.fields, args.json)
@@ -0,0 +1,63 @@
+"""
+唯一性验证基准测试。
+
+分别以整数、字典元素的列表测量 ``List(unique_items=True)`` 的验证耗时，并与逐个比较的实现对比，
+元素数量翻倍时耗时应大致翻倍::
+
+    python benchmarks/unique_items.py --items 5000 10000 20000
+    python benchmarks/unique_items.py --items 20000 --json >> bench_output.txt
+"""
+import argparse
+
+from _utils import report, setup_django, timeit
+
+
+def scan_unique_validate(items):
+    """逐个比较的实现，用于对比。"""
+    unique = []
+    for item in items:
+        if item in unique:
+            raise ValueError
+        unique.append(item)
+
+
+def main(sizes, number: int, as_json: bool):
+    setup_django()
+
+    from django_oasis import schema  # noqa: F401 先于 django_oasis_schema 导入，避免循环导入
+    from django_oasis_schema._validators import unique_validate
+
+    for items in sizes:
+        payloads = {
+            "int": list(range(items)),
+            "dict": [{"id": i, "tags": ["a", "b"]} for i in range(items)],
+        }
+        for kind, payload in payloads.items():
+            report(
+                f"unique_items.{kind}",
+                {
+                    "items": items,
+                    "validate_time": timeit(
+                        lambda: unique_validate(payload), number=number
+                    ),
+                    "scan_time": timeit(
+                        lambda: scan_unique_validate(payload), number=1, repeat=1
+                    ),
+                },
+                as_json,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="测量唯一性验证随元素数量的耗时")
+    parser.add_argument(
+        "--items",
+        type=int,
+        nargs="+",
+        default=[5000, 10000, 20000],
+        help="列表元素数量",
+    )
+    parser.add_argument("--number", type=int, default=5, help="每次测量的调用次数")
+    parser.add_argument("--json", action="store_true", help="以 JSON 行格式输出")
+    args = parser.parse_args()
+    main(args.items, args.number, args.json)
@@ -0,0 +1,14 @@
+from django_oasis.common import model2schema
+from django_oasis.core import Resource
+from django_oasis.pagination import CursorPagination
+
+from .models import Book
+
+
+@Resource("/books/cursor")
+class BookListAPI:
+    def get(
+        self,
+        pagination=CursorPagination(model2schema(Book), ordering="-id"),  # 设置分页器
+    ):
+        return pagination.paginate(Book.objects.all())  # 使用分页器
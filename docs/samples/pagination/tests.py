@@ -1,5 +1,7 @@
 import pytest
 
+from django_oasis import schema
+
 from . import urls
 from .page_pagination import Book
 
@@ -17,3 +19,217 @@ def test_page_pagination(client):
         "results": [{"author": "老刘", "id": i, "title": "三体"} for i in range(1, 21)],
         "count": 30,
     }
+
+
+@pytest.mark.urls(urls)
+@pytest.mark.django_db
+def test_cursor_pagination(client):
+    Book.objects.bulk_create([Book(title="三体", author="老刘")] * 5)
+
+    response = client.get("/books/cursor", {"page_size": 2})
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["id"] for r in data["results"]] == [5, 4]
+    assert data["previous"] is None
+
+    data = client.get("/books/cursor", {"page_size": 2, "cursor": data["next"]}).json()
+    assert [r["id"] for r in data["results"]] == [3, 2]
+
+    next_cursor = data["next"]
+    data = client.get("/books/cursor", {"page_size": 2, "cursor": data["previous"]})
+    assert [r["id"] for r in data.json()["results"]] == [5, 4]
+
+    data = client.get("/books/cursor", {"page_size": 2, "cursor": next_cursor}).json()
+    assert [r["id"] for r in data["results"]] == [1]
+    assert data["next"] is None
+
+    response = client.get("/books/cursor", {"cursor": "invalid"})
+    assert response.status_code == 400
+    assert response.json() == {
+        "validation_errors": [{"msgs": ["Not a valid cursor."], "loc": ["cursor"]}]
+    }
+
+
+def _encode_cursor(data) -> str:
+    import base64
+    import json
+
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+@pytest.mark.urls(urls)
+@pytest.mark.django_db
+@pytest.mark.parametrize("position", [["abc"], [{"x": 1}], [[1]], [1, 2]])
+def test_cursor_pagination_invalid_position(client, position):
+    cursor = _encode_cursor({"p": position, "r": False})
+    response = client.get("/books/cursor", {"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json() == {
+        "validation_errors": [{"msgs": ["Not a valid cursor."], "loc": ["cursor"]}]
+    }
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_microseconds(rf):
+    import datetime
+
+    from django_oasis.pagination import CursorPagination
+    from samples.demo.models import Book as DemoBook
+
+    created_at = datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc)
+    for i in range(4):
+        book = DemoBook.objects.create(title=str(i))
+        # 同一毫秒内的不同时间
+        DemoBook.objects.filter(pk=book.pk).update(
+            created_at=created_at + datetime.timedelta(microseconds=100 * i)
+        )
+
+    pagination = CursorPagination(
+        schema.Model.from_dict({"title": schema.String()}),
+        ordering="created_at",
+        page_size=2,
+    )
+    data = pagination.parse_request(rf.get("/")).paginate(DemoBook.objects.all())
+    assert [b.title for b in data["results"]] == ["0", "1"]
+    data = pagination.parse_request(rf.get("/", {"cursor": data["next"]})).paginate(
+        DemoBook.objects.all()
+    )
+    assert [b.title for b in data["results"]] == ["2", "3"]
+
+
+@pytest.mark.django_db
+def test_cursor_pagination_foreign_key(rf):
+    from django.contrib.auth.models import Permission
+
+    from django_oasis.pagination import CursorPagination
+
+    # 外键以列值 (content_type_id) 排序及生成游标
+    pagination = CursorPagination(
+        schema.Model.from_dict({"codename": schema.String()}),
+        ordering=["-content_type", "pk"],
+        page_size=3,
+    )
+    queryset = Permission.objects.all()
+    expected = list(
+        queryset.order_by("-content_type_id", "pk").values_list("codename", flat=True)
+    )
+    assert len(expected) > 6
+
+    results, cursor = [], None
+    while True:
+        request = rf.get("/", {"cursor": cursor} if cursor else {})
+        data = pagination.parse_request(request).paginate(queryset)
+        results.extend(p.codename for p in data["results"])
+        cursor = data["next"]
+        if cursor is None:
+            break
+    assert results == expected
+
+    pagination = CursorPagination(schema.Model, ordering=["user", "pk"])
+    with pytest.raises(ValueError):
+        pagination.parse_request(rf.get("/")).paginate(queryset)
+
+
+@pytest.mark.django_db
+def test_pagination_count_modes(rf):
+    from django.core.cache import cache
+
+    from django_oasis.pagination import PagePagination
+
+    Book.objects.bulk_create([Book(title="三体", author="老刘")] * 3)
+    request = rf.get("/")
+
+    pagination = PagePagination(schema.Model, count="none")
+    assert "count" not in type(pagination._get_response_schema()).fields
+
+    # SQLite 不支持估算，使用精确计数
+    pagination = PagePagination(schema.Model, count="estimate")
+    assert pagination.parse_request(request).paginate(Book.objects.all())["count"] == 3
+
+    cache.clear()
+    pagination = PagePagination(schema.Model, count="cached")
+    assert pagination.parse_request(request).paginate(Book.objects.all())["count"] == 3
+    Book.objects.create(title="球状闪电", author="老刘")
+    assert pagination.parse_request(request).paginate(Book.objects.all())["count"] == 3
+    assert pagination.parse_request(request).paginate(Book.objects.none())["count"] == 0
+    # str(query) 相同的不同查询不共用缓存
+    Book.objects.create(title="a, b", author="老刘")
+    for titles, count in ((["a", "b"], 0), (["a, b"], 1)):
+        queryset = Book.objects.filter(title__in=titles)
+        assert pagination.parse_request(request).paginate(queryset)["count"] == count
+
+    with pytest.raises(ValueError):
+        PagePagination(schema.Model, count="unknown")
+
+
+@pytest.mark.django_db
+def test_pagination_count_estimate(rf, monkeypatch):
+    import json
+
+    from django.core.exceptions import EmptyResultSet
+    from django.db import connection
+    from django.db.models import QuerySet
+
+    from django_oasis.pagination import PagePagination
+
+    plans = {}
+
+    def explain(self, *, format=None, **options):
+        assert format == "json"
+        if self.query.is_empty():
+            raise EmptyResultSet
+        return plans["plan"]
+
+    # 模拟 PostgreSQL 的 EXPLAIN (FORMAT JSON) 结果
+    monkeypatch.setattr(connection, "vendor", "postgresql")
+    monkeypatch.setattr(QuerySet, "explain", explain)
+    Book.objects.bulk_create([Book(title="三体", author="老刘")] * 3)
+    bound = PagePagination(schema.Model, count="estimate").parse_request(rf.get("/"))
+
+    def count(queryset):
+        return bound.paginate(queryset)["count"]
+
+    plans["plan"] = json.dumps([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 5000}}])
+    assert count(Book.objects.all()) == 5000
+    # 估算值较小时使用精确计数
+    plans["plan"] = json.dumps([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 10}}])
+    assert count(Book.objects.all()) == 3
+    # 无法得到估算值时使用精确计数
+    for plan in ("[]", "[{}]", '[{"Plan": {}}]', '[{"Plan": {"Plan Rows": null}}]'):
+        plans["plan"] = plan
+        assert count(Book.objects.all()) == 3
+    # 查询集必定为空
+    assert count(Book.objects.none()) == 0
+
+
+@pytest.mark.django_db
+def test_bound_pagination(rf):
+    from django_oasis.pagination import BoundPagination, OffsetPagination
+
+    pagination = OffsetPagination(schema.Model)
+    pagination.extra = "extra"
+    bound = pagination.parse_request(rf.get("/", {"limit": 5}))
+    assert isinstance(bound, BoundPagination)
+    assert bound.pagination is pagination
+    assert bound.reqarg == {"offset": 0, "limit": 5}
+    assert bound.extra == "extra"
+    assert bound.paginate(Book.objects.all())["limit"] == 5
+
+    with pytest.raises(RuntimeError):
+        pagination.paginate(Book.objects.all())
+
+
+@pytest.mark.django_db
+def test_bound_pagination_subclass(rf):
+    from django_oasis.pagination import OffsetPagination
+
+    class AuthorPagination(OffsetPagination):
+        def paginate(self, queryset):
+            return super().paginate(queryset.filter(author="老刘"))
+
+    Book.objects.create(title="三体", author="老刘")
+    Book.objects.create(title="活着", author="余华")
+
+    bound = AuthorPagination(schema.Model).parse_request(rf.get("/"))
+    assert isinstance(bound, AuthorPagination)
+    assert [b.title for b in bound.paginate(Book.objects.all())["results"]] == ["三体"]
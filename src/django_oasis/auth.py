@@ -2,6 +2,7 @@ import abc
 import typing as t
 from http import HTTPStatus
 
+from asgiref.sync import iscoroutinefunction, sync_to_async
 from django.conf import settings
 from django.http import HttpRequest
 
@@ -25,7 +26,18 @@ class BaseAuth:
         需自行实现该方法，用于判断请求认证是否成功。如果认证失败，需要抛出异常来停止请求的继续处理。
 
         :param request: Django `HttpRequest <https://docs.djangoproject.com/zh-hans/5.0/ref/request-response/#httprequest-objects>`_ 对象。
+
+        该方法也可以定义为协程函数，在同步视图中会被同步调用。
+        """
+
+    async def acheck_auth(self, request):
+        """
+        在异步视图中代替 `check_auth` 被调用。默认在 `check_auth` 为协程函数时直接等待它，否则在线程中执行它。
         """
+        if iscoroutinefunction(self.check_auth):
+            await self.check_auth(request)
+        else:
+            await sync_to_async(self.check_auth)(request)
 
     def __openapispec__(self, oas):
         if hasattr(self, "declare_security"):
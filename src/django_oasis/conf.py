@@ -0,0 +1,21 @@
+import typing as t
+
+from django.conf import settings
+
+#: django_oasis 可用的 Django 配置项及其默认值。
+DEFAULTS: t.Dict[str, t.Any] = {
+    # 预先导出的 OAS 文件目录。设置后 OpenAPI.spec_view 直接读取该目录中的文件，参考 export_apispec 命令。
+    "OASIS_PREBUILT_SPEC_DIR": None,
+    # 是否根据响应数据结构自动投影查询集的字段，参考 django_oasis.utils.django.QuerySetProjection。
+    "OASIS_QUERYSET_PROJECTION": True,
+    # JSON 编码/解码后端，参考 django_oasis.json_backends。
+    "OASIS_JSON_BACKEND": "stdlib",
+    # 解析请求参数时，是否在遇到第一个验证错误时就停止验证，可被 Operation 的 fail_fast 参数覆盖。
+    "OASIS_FAIL_FAST": False,
+    # 请求数据的大小及复杂度限制，可被 Operation 的 limits 参数覆盖，参考 django_oasis.limits。
+    "OASIS_REQUEST_LIMITS": {},
+}
+
+
+def get_setting(name: str):
+    return getattr(settings, name, DEFAULTS[name])
@@ -6,31 +6,49 @@ import hashlib
 import inspect
 import os
 import sys
+import threading
 import typing as t
 import warnings
 from http import HTTPStatus
 
 import django.urls
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
 from build_openapispec import openapispec
 from django.conf import settings
-from django.http import HttpRequest, HttpResponse
-from django.http.response import HttpResponseBase, JsonResponse
+from django.core.exceptions import SynchronousOnlyOperation
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import QuerySet
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
+from django.http.response import HttpResponseBase
 from django.utils.functional import cached_property
+from django.utils.http import parse_etags
+from django.utils.text import compress_string
 from django.views.decorators.csrf import csrf_exempt
 
 from django_oasis import schema
 from django_oasis.auth import BaseAuth
+from django_oasis.conf import get_setting
 from django_oasis.exceptions import (
     HTTPError,
     MethodNotAllowedError,
     RequestValidationError,
 )
+from django_oasis.json_backends import get_json_backend
+from django_oasis.json_writer import compile_json_writer
+from django_oasis.limits import RequestLimits, request_limits_context
 from django_oasis.parameter.parameters import (
     MountPoint,
     MountPointSetWrapper,
     Path,
     RequestParameterComponent,
 )
+from django_oasis.utils.django import QuerySetProjection
+from django_oasis_schema import fail_fast_context
 from django_oasis_schema.utils import make_instance, make_model_schema, make_schema
 
 __all__ = ("OpenAPI", "Resource", "Operation")
@@ -42,15 +60,22 @@ def _get_openapi_instance_id():
     return hashlib.md5(rv.encode()).hexdigest()[:8]
 
 
+def _json_response(data, status: int = 200) -> HttpResponse:
+    """使用 `JSON 后端 <django_oasis.json_backends>` 编码的 JSON 响应。"""
+    return HttpResponse(
+        get_json_backend().dumps(data), status=status, content_type="application/json"
+    )
+
+
 def handle_request_validation_error(e: RequestValidationError, request):
-    return JsonResponse(
+    return _json_response(
         {"validation_errors": e.exc.format_errors()},
         status=400,
     )
 
 
 def handle_http_error(e: HTTPError, request):
-    return JsonResponse(
+    return _json_response(
         {
             "status_code": e.status_code,
             "reason": e.reason,
@@ -65,12 +90,100 @@ DEFAULT_ERROR_HANDLERS: t.Dict[t.Type[Exception], t.Callable] = {
 }
 
 
+def prebuilt_spec_path(directory: str, path_info: str, extension: str = "json") -> str:
+    """预先导出的 OAS 文件路径，与 OAS 端点的 URL 路径对应。如 "/sub/api/apispec_xxx" 对应 "<directory>/sub/api/apispec_xxx.json"。"""
+    directory = os.path.realpath(directory)
+    rv = os.path.realpath(
+        os.path.join(directory, path_info.strip("/") + "." + extension)
+    )
+    if os.path.commonpath([directory, rv]) != directory:
+        raise ValueError("Invalid path: %r" % path_info)
+    return rv
+
+
+class _EncodedSpec:
+    """编码后的 OAS 数据及其 ETag，压缩后的数据在首次使用时生成并缓存。"""
+
+    # 与 GZipMiddleware 一致，过小的数据压缩后收益不大。
+    min_compress_length = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+        # 不同压缩编码的内容在语义上等价，所以使用弱 ETag。
+        self.etag = 'W/"%s"' % hashlib.sha1(content).hexdigest()
+        self.__compressed: t.Dict[str, t.Optional[bytes]] = {}
+
+    def match(self, if_none_match: str) -> bool:
+        etags = parse_etags(if_none_match)
+        if "*" in etags:
+            return True
+        opaque_tag = self.etag[2:]
+        return any((e[2:] if e.startswith("W/") else e) == opaque_tag for e in etags)
+
+    def negotiate(self, accept_encoding: str) -> t.Tuple[t.Optional[str], bytes]:
+        if len(self.content) >= self.min_compress_length:
+            qvalues = _parse_accept_encoding(accept_encoding)
+            default = qvalues.get("*", 0.0)
+            # q 值较大的编码优先，相同时按 _ACCEPT_ENCODINGS 中的顺序，q=0 表示不可接受
+            for encoding in sorted(
+                _ACCEPT_ENCODINGS, key=lambda e: -qvalues.get(e, default)
+            ):
+                if qvalues.get(encoding, default) <= 0:
+                    break
+                compressed = self.__compress(encoding)
+                if compressed is not None:
+                    return encoding, compressed
+        return None, self.content
+
+    def __compress(self, encoding: str) -> t.Optional[bytes]:
+        if encoding not in self.__compressed:
+            compressed: t.Optional[bytes]
+            if encoding == "br":
+                try:
+                    import brotli
+                except ImportError:
+                    compressed = None
+                else:
+                    compressed = brotli.compress(self.content)
+            else:
+                compressed = compress_string(self.content)
+            self.__compressed[encoding] = compressed
+        return self.__compressed[encoding]
+
+
+_ACCEPT_ENCODINGS = ["br", "gzip"]
+
+
+def _parse_accept_encoding(header: str) -> t.Dict[str, float]:
+    """解析 Accept-Encoding 请求头，返回各编码的 q 值，q 值无效的项被忽略。"""
+    qvalues: t.Dict[str, float] = {}
+    for item in header.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = -1.0
+        if 0 <= q <= 1:
+            qvalues[coding] = q
+    return qvalues
+
+
 class OpenAPI:
     """
     :param name: 如果需要对外分享 OAS 数据，建议设置该名称，它将作为 OAS 数据地址的一部分，而不是使用计算出的名称。
 
     """
 
+    # 缓存的编码后 OAS 数据的最大数量
+    spec_cache_size = 8
+
     def __init__(
         self,
         *,
@@ -89,6 +202,10 @@ class OpenAPI:
             DEFAULT_ERROR_HANDLERS.copy()
         )
         self.__path_dict: dict[str, tuple[Resource, list[str]]] = {}
+        self.__spec_cache: t.Dict[tuple, _EncodedSpec] = {}
+        # 多个线程可能同时读写缓存
+        self.__spec_cache_lock = threading.Lock()
+        self.__prebuilt_specs: t.Dict[str, _EncodedSpec] = {}
 
     @property
     def title(self):
@@ -130,6 +247,7 @@ class OpenAPI:
             prefix + django_path, resource.view_func, name=resource.url_name
         )
         self.__path_dict[prefix + openapi_path] = (resource, tags or [])
+        self.__spec_cache.clear()
 
     def __append_url(self, path, *args, **kwargs):
         path = path.lstrip("/")
@@ -139,33 +257,27 @@ class OpenAPI:
     def urls(self):
         return self.__urls
 
-    def get_spec(self, request: HttpRequest | None = None):
-        oas = openapispec("3.0.3")
-
+    def __resolve_spec_key(
+        self, request: HttpRequest | None
+    ) -> t.Tuple[str, str, t.Optional[str]]:
+        """从请求中解析出影响 OAS 内容的参数: (script_name, prefix, description)。"""
+        description: t.Optional[str] = None
         if self.__description:
             if isinstance(self.__description, str):
                 description = self.__description
             elif request:
                 description = self.__description(request)
-            else:
-                description = oas.empty
-        else:
-            description = oas.empty
 
         if request:
             script_name = request.path[: -len(request.path_info)]
-            if script_name:
-                server = [{"url": script_name}]
-            else:
-                server = oas.empty
+            prefix = request.path_info[: -len(self.__spec_endpoint)]
         else:
-            server = oas.empty
+            script_name = prefix = ""
 
-        prefix = (
-            request.path_info[: -len(self.__spec_endpoint)]
-            if request is not None
-            else ""
-        )
+        return script_name, prefix, description
+
+    def __build_spec(self, script_name: str, prefix: str, description: str | None):
+        oas = openapispec("3.0.3")
 
         spec = oas.build(
             oas.OpenAPIObject(
@@ -174,24 +286,73 @@ class OpenAPI:
                         {
                             "title": self.__title,
                             "version": "0.1.0",
-                            "description": description,
+                            "description": (
+                                oas.empty if description is None else description
+                            ),
                         }
                     ),
                     "paths": {
                         prefix + k: oas.PathItemObject(r.__openapispec__(oas, ts))
                         for k, (r, ts) in self.__path_dict.items()
                     },
-                    "server": server,
+                    "server": [{"url": script_name}] if script_name else oas.empty,
                 }
             )
         )
 
         return spec
 
+    def get_spec(self, request: HttpRequest | None = None):
+        return self.__build_spec(*self.__resolve_spec_key(request))
+
+    @staticmethod
+    def _dump_spec(spec: dict) -> bytes:
+        return get_json_backend().dumps(spec, pretty=settings.DEBUG)
+
+    def __get_prebuilt_spec(self, request: HttpRequest) -> t.Optional[_EncodedSpec]:
+        directory = get_setting("OASIS_PREBUILT_SPEC_DIR")
+        if not directory:
+            return None
+
+        filename = prebuilt_spec_path(directory, request.path_info)
+        encoded = self.__prebuilt_specs.get(filename)
+        if encoded is None:
+            # 只读取一次，之后的响应直接使用同一个 bytes 对象，HttpResponse 不会再复制它
+            try:
+                with open(filename, "rb") as fp:
+                    content = fp.read()
+            except FileNotFoundError:
+                return None
+            encoded = self.__prebuilt_specs[filename] = _EncodedSpec(content)
+        return encoded
+
     def spec_view(self, request: HttpRequest):
-        spec = self.get_spec(request)
-        json_dumps_params = dict(indent=2, ensure_ascii=False) if settings.DEBUG else {}
-        return JsonResponse(spec, json_dumps_params=json_dumps_params)
+        encoded = self.__get_prebuilt_spec(request)
+        if encoded is None:
+            # 相同参数构建出的 OAS 相同，缓存编码后的 JSON 数据，在添加资源时清空。
+            # description 可以由每个请求生成，所以只保留最近使用的若干项。
+            key = (*self.__resolve_spec_key(request), settings.DEBUG)
+            with self.__spec_cache_lock:
+                encoded = self.__spec_cache.pop(key, None)
+            if encoded is None:
+                encoded = _EncodedSpec(self._dump_spec(self.__build_spec(*key[:3])))
+            with self.__spec_cache_lock:
+                self.__spec_cache.pop(key, None)
+                while len(self.__spec_cache) >= self.spec_cache_size:
+                    del self.__spec_cache[next(iter(self.__spec_cache))]
+                self.__spec_cache[key] = encoded
+
+        headers = {"ETag": encoded.etag, "Vary": "Accept-Encoding"}
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and encoded.match(if_none_match):
+            return HttpResponseNotModified(headers=headers)
+
+        encoding, content = encoded.negotiate(
+            request.headers.get("Accept-Encoding", "")
+        )
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return HttpResponse(content, content_type="application/json", headers=headers)
 
     def register_schema(self, schema):
         schema = make_model_schema(schema)
@@ -260,6 +421,18 @@ class Resource:
 
         def operation_decorator(source_decorator, http_method):
             def decorator(view):
+                if iscoroutinefunction(view):
+
+                    @functools.wraps(view)
+                    async def async_wrapper(request, *args, **kwargs):
+                        if request.method == http_method:
+                            return await source_decorator(view)(
+                                request, *args, **kwargs
+                            )
+                        return await view(request, *args, **kwargs)
+
+                    return async_wrapper
+
                 @functools.wraps(view)
                 def wrapper(request, *args, **kwargs):
                     if request.method == http_method:
@@ -309,21 +482,39 @@ class Resource:
         except TypeError:
             return None
 
+    @property
+    def is_async(self) -> bool:
+        """如果有 Operation 的处理方法是协程函数，则 `view_func` 为异步视图。"""
+        return any(o._is_async for o in self.__operations.values())
+
+    def __handle_view_error(self, exc, request):
+        if "django_oasis.middleware.ErrorHandlerMiddleware" in settings.MIDDLEWARE:
+            request._oasis_handle_error = self._handle_error
+            raise exc
+        return self._handle_error(exc, request)
+
     @cached_property
     def view_func(self):
-        @csrf_exempt
-        def view(request, **kwargs) -> HttpResponseBase:
-            try:
-                rv, status_code = self.__view(request, **kwargs)
-            except Exception as exc:
-                if (
-                    "django_oasis.middleware.ErrorHandlerMiddleware"
-                    in settings.MIDDLEWARE
-                ):
-                    request._oasis_handle_error = self._handle_error
-                    raise
-                return self._handle_error(exc, request)
-            return self.__make_response(rv, status_code)
+        if self.is_async:
+
+            async def view(request, **kwargs) -> HttpResponseBase:
+                try:
+                    rv, status_code = await self.__async_view(request, **kwargs)
+                except Exception as exc:
+                    return self.__handle_view_error(exc, request)
+                return self.__make_response(rv, status_code)
+
+            view.csrf_exempt = True  # type: ignore
+
+        else:
+
+            @csrf_exempt
+            def view(request, **kwargs) -> HttpResponseBase:
+                try:
+                    rv, status_code = self.__view(request, **kwargs)
+                except Exception as exc:
+                    return self.__handle_view_error(exc, request)
+                return self.__make_response(rv, status_code)
 
         for decorator in self.__get_view_decorators():
             view = decorator(view)
@@ -337,9 +528,9 @@ class Resource:
             rv = b""
         if isinstance(rv, (str, bytes)):
             return HttpResponse(rv, status=status)
-        return JsonResponse(rv, status=status, safe=False)
+        return _json_response(rv, status=status)
 
-    def __view(self, request, **kwargs) -> t.Tuple[t.Any, int]:
+    def __get_handler(self, request, kwargs):
         kwargs = self._path.parse_kwargs(kwargs)
 
         method = request.method.lower()
@@ -353,9 +544,18 @@ class Resource:
         else:
             raise MethodNotAllowedError
 
-        operation = self.__operations[method]
+        return self.__operations[method], handler
+
+    def __view(self, request, **kwargs) -> t.Tuple[t.Any, int]:
+        operation, handler = self.__get_handler(request, kwargs)
         return operation._wrapped_invoke(handler, request)
 
+    async def __async_view(self, request, **kwargs) -> t.Tuple[t.Any, int]:
+        operation, handler = self.__get_handler(request, kwargs)
+        if operation._is_async:
+            return await operation._async_wrapped_invoke(handler, request)
+        return await sync_to_async(operation._wrapped_invoke)(handler, request)
+
     def __openapispec__(self, oas, tags: list[str] | None = None) -> dict:
         if not self.__include_in_spec:
             return {}
@@ -370,6 +570,16 @@ class Resource:
         return operations
 
 
+async def _aiter_in_thread(iterator: t.Iterator[bytes]) -> t.AsyncIterator[bytes]:
+    """在线程中逐个获取同步迭代器的元素，避免查询数据库及序列化阻塞事件循环。"""
+    sentinel = object()
+    while True:
+        chunk = await sync_to_async(next)(iterator, sentinel)
+        if chunk is sentinel:
+            break
+        yield chunk
+
+
 class Operation:
     """
     :param include_in_spec: 是否将当前操作解析到 OAS 中，默认为 `True`。
@@ -377,6 +587,12 @@ class Operation:
     :param auth: 设置操作请求认证。
     :param declare_responses: 声明可能的请求响应，用于构建 OAS。
     :param response_schema: 用于序列化请求操作返回值，并为 OAS 提供响应描述。
+    :param stream: 是否使用流式响应。为 `True` 时，``response_schema`` 必须是 `List <django_oasis.schema.List>`，
+        返回值 (如查询集) 的元素会被逐个序列化并以 JSON 数组输出，内存占用不会随数据量增长。
+    :param stream_chunk_size: 流式响应时，每次从数据库获取并输出的元素数量。
+    :param fail_fast: 解析请求参数时，是否在遇到第一个验证错误时就停止验证。默认为 `None`，使用 ``OASIS_FAIL_FAST`` 配置。
+    :param limits: 请求数据的大小及复杂度限制，如 ``{"max_body_size": 1024}``，其中的项覆盖 ``OASIS_REQUEST_LIMITS`` 配置。
+        可用的项参考 `RequestLimits <django_oasis.limits.RequestLimits>`。
 
     .. deprecated:: 0.1
         view_decorators 是一个设计错误的参数，勿用。
@@ -397,6 +613,10 @@ class Operation:
         status_code: int = 200,
         view_decorators: t.Optional[list] = None,
         declare_responses: t.Optional[dict] = None,
+        stream: bool = False,
+        stream_chunk_size: int = 2000,
+        fail_fast: t.Optional[bool] = None,
+        limits: t.Optional[t.Dict[str, int]] = None,
     ):
         self.__tags = tags or []
         self.__summary = summary
@@ -410,12 +630,19 @@ class Operation:
         self.__declare_responses = declare_responses
         self.__include_in_spec = include_in_spec
         self.__status_code = status_code
+        self.__stream = stream
+        self.__stream_chunk_size = stream_chunk_size
+        self.__fail_fast = fail_fast
+        self.__limits = RequestLimits(**(limits or {}))
+        # (OASIS_REQUEST_LIMITS 配置对象, 合并后的限制)，配置未变时复用合并结果
+        self.__merged_limits: t.Optional[t.Tuple[dict, RequestLimits]] = None
         self.__response_description = HTTPStatus(status_code).phrase
         self.__self_auth: t.Optional[BaseAuth] = (
             None if auth is None else make_instance(auth)
         )
         self._resource: t.Optional[Resource] = None
         self._view_decorators = view_decorators or []
+        self._is_async = False
 
         if view_decorators is not None:
             warnings.warn(
@@ -445,32 +672,156 @@ class Operation:
         self.__parse_parameters(handler)
         assert not hasattr(handler, "operation")
         handler.operation = self
+        self._is_async = iscoroutinefunction(handler)
+
+        if self.__stream and not isinstance(self.response_schema, schema.List):
+            raise ValueError("stream requires a List response_schema.")
 
         if self.__description is None:
             self.__description = inspect.getdoc(handler)
 
         return handler
 
+    def __is_fail_fast(self) -> bool:
+        if self.__fail_fast is None:
+            return get_setting("OASIS_FAIL_FAST")
+        return self.__fail_fast
+
+    def __get_limits(self) -> RequestLimits:
+        config = get_setting("OASIS_REQUEST_LIMITS")
+        if self.__merged_limits is None or self.__merged_limits[0] is not config:
+            limits = RequestLimits(**config).override(self.__limits)
+            self.__merged_limits = (config, limits)
+        return self.__merged_limits[1]
+
     def _wrapped_invoke(self, handler, request) -> t.Tuple[t.Any, int]:
         if self.__auth:
-            self.__auth.check_auth(request)
+            if iscoroutinefunction(self.__auth.check_auth):
+                async_to_sync(self.__auth.check_auth)(request)
+            else:
+                self.__auth.check_auth(request)
 
-        kwargs = self.__mountpointset.parse_request(request)
+        limits = self.__get_limits()
+        limits.check_content_length(request)
+        with fail_fast_context(self.__is_fail_fast()), request_limits_context(limits):
+            kwargs = self.__mountpointset.parse_request(request)
         rv = handler(**kwargs)
-        if not isinstance(rv, HttpResponseBase) and self.response_schema:
-            try:
-                rv = self.response_schema.serialize(rv)
-            except Exception as e:
-                raise ValueError(
-                    f"{rv} cannot be serialized by {self.response_schema}."
-                ) from e
+        if self.__stream and not isinstance(rv, HttpResponseBase):
+            # ASGI 下同步的流式内容会被 Django 一次性读入内存，需要转换为异步迭代器
+            return (
+                self.__make_streaming_response(
+                    rv, is_async=isinstance(request, ASGIRequest)
+                ),
+                self.__status_code,
+            )
+        return self.__serialize_response(rv), self.__status_code
+
+    async def _async_wrapped_invoke(self, handler, request) -> t.Tuple[t.Any, int]:
+        if self.__auth:
+            await self.__auth.acheck_auth(request)
+
+        limits = self.__get_limits()
+        limits.check_content_length(request)
+        with fail_fast_context(self.__is_fail_fast()), request_limits_context(limits):
+            kwargs = await self.__mountpointset.aparse_request(request)
+        rv = await handler(**kwargs)
+        if self.__stream and not isinstance(rv, HttpResponseBase):
+            return self.__make_streaming_response(rv, is_async=True), self.__status_code
+        try:
+            rv = self.__serialize_response(rv)
+        except SynchronousOnlyOperation:
+            # 返回值中包含未求值的 QuerySet 等，需要在线程中序列化。
+            rv = await sync_to_async(self.__serialize_response)(rv)
         return rv, self.__status_code
 
+    @cached_property
+    def __projection(self) -> t.Optional[QuerySetProjection]:
+        if isinstance(self.response_schema, schema.List):
+            return QuerySetProjection(self.response_schema._item)
+        return None
+
+    @cached_property
+    def __json_writers(self) -> t.Dict[t.Any, t.Callable[[t.Any], bytes]]:
+        return {}
+
+    def __get_json_writer(self, item: bool = False) -> t.Callable[[t.Any], bytes]:
+        """按照当前的 JSON 后端编译 ``response_schema`` (或其列表元素) 的 JSON 写入函数。"""
+        backend = get_json_backend()
+        key = (backend, item)
+        if key not in self.__json_writers:
+            response_schema = self.response_schema
+            if item:
+                assert isinstance(response_schema, schema.List)
+                response_schema = response_schema._item
+            self.__json_writers[key] = compile_json_writer(
+                response_schema, encode=lambda v: backend.dumps(v).decode()
+            )
+        return self.__json_writers[key]
+
+    def __serialize_response(self, rv):
+        if isinstance(rv, HttpResponseBase) or not self.response_schema:
+            return rv
+        if self.__stream:
+            return self.__make_streaming_response(rv)
+        if isinstance(rv, QuerySet) and self.__projection is not None:
+            rv = self.__projection.apply(rv)
+        try:
+            if rv is not None and isinstance(
+                self.response_schema, (schema.Model, schema.List, schema.Dict)
+            ):
+                # 直接编码为 JSON 响应，不生成序列化的中间数据
+                return HttpResponse(
+                    self.__get_json_writer()(rv),
+                    status=self.__status_code,
+                    content_type="application/json",
+                )
+            return self.response_schema.serialize(rv)
+        except SynchronousOnlyOperation:
+            raise
+        except Exception as e:
+            raise ValueError(
+                f"{rv} cannot be serialized by {self.response_schema}."
+            ) from e
+
+    def __iter_json_chunks(self, rv) -> t.Iterator[bytes]:
+        chunk_size = self.__stream_chunk_size
+        if isinstance(rv, QuerySet):
+            if self.__projection is not None:
+                rv = self.__projection.apply(rv)
+            rv = rv.iterator(chunk_size=chunk_size)
+
+        write = self.__get_json_writer(item=True)
+        buffer: t.List[bytes] = []
+        separator = b"["
+        for item in rv:
+            buffer.append(separator)
+            buffer.append(write(item))
+            separator = b","
+            if len(buffer) >= chunk_size * 2:
+                yield b"".join(buffer)
+                buffer.clear()
+        if not buffer and separator == b"[":
+            buffer.append(b"[")
+        buffer.append(b"]")
+        yield b"".join(buffer)
+
+    def __make_streaming_response(self, rv, is_async: bool = False):
+        chunks: t.Union[t.Iterator[bytes], t.AsyncIterator[bytes]]
+        chunks = self.__iter_json_chunks(rv)
+        if is_async:
+            chunks = _aiter_in_thread(chunks)
+        return StreamingHttpResponse(
+            chunks, status=self.__status_code, content_type="application/json"
+        )
+
     def __openapispec__(self, oas, tags: list[str]) -> dict:
         if not self.__include_in_spec:
             return {}
 
         other_responses = {}
+        if self.__get_limits().max_body_size is not None:
+            other_responses[413] = {"description": HTTPStatus(413).phrase}
+
         if self.__auth and hasattr(self.__auth, "declare_responses"):
             other_responses.update(self.__auth.declare_responses)
 
@@ -22,29 +22,10 @@ def _get_swagger_ui_html(config: dict, insert_head="", env=None):
 
 @functools.lru_cache
 def _get_swagger_ui_urls():
-    from django.urls import URLPattern, URLResolver, get_resolver
+    from django_oasis.utils.project import iter_spec_endpoints
 
-    from django_oasis.core import OpenAPI
-
-    spec_view = OpenAPI.spec_view
-    lookup_str = spec_view.__module__ + "." + spec_view.__qualname__
-
-    def _traverse_pattern_endpoints(patterns, namespaces=None):
-        # 变量所有路由端点，找出 OpenAPI.spec_view 函数及路由名称(命名空间)。
-        namespaces = namespaces or []
-        for pattern in patterns:
-            if isinstance(pattern, URLPattern):
-                if pattern.lookup_str == lookup_str:
-                    yield namespaces, pattern.name, pattern.callback
-            elif isinstance(pattern, URLResolver):
-                ns = namespaces.copy()
-                if pattern.namespace:
-                    ns.append(pattern.namespace)
-                yield from _traverse_pattern_endpoints(pattern.url_patterns, ns)
-
-    patterns = get_resolver().url_patterns
     name_to_urls = defaultdict(list)
-    for namespaces, view_name, view in _traverse_pattern_endpoints(patterns):
+    for namespaces, view_name, view in iter_spec_endpoints():
         name_to_urls[view.__self__.title].append(
             reverse_lazy(":".join(namespaces + [view_name]))
         )
@@ -54,6 +54,12 @@ class ForbiddenError(HTTPError):
     status_code = 403
 
 
+class PayloadTooLargeError(HTTPError):
+    """请求体超过大小限制时抛出，默认返回 HTTP 413 响应。"""
+
+    status_code = 413
+
+
 class UnsupportedMediaTypeError(HTTPError):
     """请求内容类型与要求不符时抛出，默认返回 HTTP 415 响应。"""
 
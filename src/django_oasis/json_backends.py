@@ -0,0 +1,162 @@
+"""
+JSON 编码/解码后端。
+
+请求数据的解析、响应数据及 OAS 的输出都会使用 `get_json_backend` 返回的后端，通过 Django 配置项 ``OASIS_JSON_BACKEND`` 选择:
+
+- ``"stdlib"``: 默认值，使用标准库 json 及 Django 的 ``DjangoJSONEncoder``。
+- ``"orjson"``: 使用 `orjson <https://github.com/ijl/orjson>`_。
+- ``"msgspec"``: 使用 `msgspec <https://github.com/jcrist/msgspec>`_。
+- ``"auto"``: 依次尝试 orjson、msgspec，都未安装时使用标准库。
+- 自定义后端的导入路径，该类需要继承 `BaseJSONBackend`。
+
+指定的第三方库未安装时，会发出警告并回退到标准库。
+"""
+
+import functools
+import importlib.util
+import json
+import typing as t
+import warnings
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+from django_oasis.conf import get_setting
+
+__all__ = (
+    "BaseJSONBackend",
+    "StdlibJSONBackend",
+    "OrjsonBackend",
+    "MsgspecBackend",
+    "get_json_backend",
+)
+
+
+def _default(obj):
+    # 第三方库不支持的类型 (如 Decimal、Promise 等) 交给 DjangoJSONEncoder 处理。
+    return DjangoJSONEncoder().default(obj)
+
+
+class BaseJSONBackend:
+    """JSON 后端基类"""
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """后端依赖的库是否已安装。"""
+        return True
+
+    def dumps(self, obj, *, pretty: bool = False) -> bytes:
+        """
+        将对象编码为 UTF-8 的 JSON 字节串。
+
+        :param pretty: 是否以 2 个空格缩进格式化输出。
+        """
+        raise NotImplementedError
+
+    def loads(self, data: t.Union[str, bytes]):
+        """解码 JSON 数据，数据无效时抛出 `ValueError`。"""
+        raise NotImplementedError
+
+
+class StdlibJSONBackend(BaseJSONBackend):
+    def dumps(self, obj, *, pretty=False):
+        if pretty:
+            return json.dumps(
+                obj, cls=DjangoJSONEncoder, indent=2, ensure_ascii=False
+            ).encode()
+        return json.dumps(obj, cls=DjangoJSONEncoder).encode()
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+_stdlib_backend = StdlibJSONBackend()
+
+
+class OrjsonBackend(BaseJSONBackend):
+    def __init__(self) -> None:
+        import orjson
+
+        self.__orjson = orjson
+
+    @classmethod
+    def is_available(cls):
+        return importlib.util.find_spec("orjson") is not None
+
+    def dumps(self, obj, *, pretty=False):
+        # 与标准库一致，允许字典的键为整数等非字符串类型
+        option = self.__orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= self.__orjson.OPT_INDENT_2
+        try:
+            return self.__orjson.dumps(obj, default=_default, option=option)
+        except TypeError:
+            # orjson 不支持超过 64 位的整数，交给标准库处理
+            return _stdlib_backend.dumps(obj, pretty=pretty)
+
+    def loads(self, data):
+        return self.__orjson.loads(data)
+
+
+class MsgspecBackend(BaseJSONBackend):
+    def __init__(self) -> None:
+        import msgspec
+
+        self.__msgspec = msgspec
+        self.__encoder = msgspec.json.Encoder(enc_hook=_default)
+        self.__decoder = msgspec.json.Decoder()
+
+    @classmethod
+    def is_available(cls):
+        return importlib.util.find_spec("msgspec") is not None
+
+    def dumps(self, obj, *, pretty=False):
+        rv = self.__encoder.encode(obj)
+        if pretty:
+            rv = self.__msgspec.json.format(rv, indent=2)
+        return rv
+
+    def loads(self, data):
+        try:
+            return self.__decoder.decode(data)
+        except self.__msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+
+_BUILTIN_BACKENDS: t.Dict[str, t.Type[BaseJSONBackend]] = {
+    "stdlib": StdlibJSONBackend,
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_backend(name: str) -> BaseJSONBackend:
+    if name == "auto":
+        for backend_class in (OrjsonBackend, MsgspecBackend):
+            if backend_class.is_available():
+                return backend_class()
+        return StdlibJSONBackend()
+
+    if name in _BUILTIN_BACKENDS:
+        backend_class = _BUILTIN_BACKENDS[name]
+    else:
+        backend_class = import_string(name)
+        if not (
+            isinstance(backend_class, type)
+            and issubclass(backend_class, BaseJSONBackend)
+        ):
+            raise TypeError(f"{name!r} is not a subclass of BaseJSONBackend.")
+
+    if not backend_class.is_available():
+        warnings.warn(
+            f"JSON backend {name!r} is not available, fall back to 'stdlib'.",
+            RuntimeWarning,
+        )
+        return StdlibJSONBackend()
+    return backend_class()
+
+
+def get_json_backend() -> BaseJSONBackend:
+    """返回 ``OASIS_JSON_BACKEND`` 配置的 JSON 后端实例。"""
+    return _load_backend(get_setting("OASIS_JSON_BACKEND"))
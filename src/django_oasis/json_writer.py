@@ -0,0 +1,221 @@
+"""
+根据数据结构直接将对象编码为 JSON。
+
+`Schema.serialize <django_oasis.schema.Schema.serialize>` 会先生成由字典和列表组成的序列化数据，然后才被编码为 JSON。
+`compile_json_writer` 将数据结构编译为写入函数，在遍历对象的同时输出 JSON 片段，不再生成序列化的中间数据。
+编码结果与先序列化、再使用 ``DjangoJSONEncoder`` 编码的结果等价。
+"""
+
+import json.encoder
+import operator
+import typing as t
+from collections.abc import Mapping
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_oasis_schema.constants import empty
+from django_oasis_schema.schemas import (
+    Boolean,
+    Datetime,
+    Dict,
+    Float,
+    Integer,
+    List,
+    Model,
+    Schema,
+    String,
+)
+from django_oasis_schema.utils import make_instance
+
+__all__ = ("compile_json_writer",)
+
+_Write = t.Callable[[t.Any, t.List[str]], None]
+
+_encode = DjangoJSONEncoder(separators=(",", ":")).encode
+_encode_string = json.encoder.encode_basestring_ascii
+
+
+def _encode_float(value: float) -> str:
+    # 与 json 模块的默认行为一致
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _is_plain(schema: Schema, klass: t.Type[Schema]) -> bool:
+    """数据结构的序列化行为是否与 ``klass`` 完全一致。"""
+    cls = type(schema)
+    return (
+        isinstance(schema, klass)
+        and cls._serialize is klass._serialize
+        and cls.serialize is Schema.serialize
+        # 作为非字段却使用了字段参数时，serialize 会发出警告，交由其处理
+        and not (hasattr(schema, "_check_info") and not schema._is_field)
+    )
+
+
+class _Compiler:
+    def __init__(self, encode: t.Callable[[t.Any], str]) -> None:
+        #: 编码无法直接写入的数据
+        self.encode = encode
+
+    def compile_fallback(self, schema: Schema) -> _Write:
+        serialize = schema.serialize
+        encode = self.encode
+
+        def write(value, out):
+            out.append(encode(serialize(value)))
+
+        return write
+
+    def compile_scalar(
+        self, schema: Schema, convert: t.Callable[[t.Any], str]
+    ) -> _Write:
+        serialize = schema.serialize
+        encode = self.encode
+
+        def write(value, out):
+            if value is None:
+                # 由 serialize 处理可空或抛出异常
+                out.append(encode(serialize(value)))
+            else:
+                out.append(convert(value))
+
+        return write
+
+    def compile_list(self, schema: List) -> _Write:
+        serialize = schema.serialize
+        encode = self.encode
+        write_item = self.compile(schema._item)
+
+        def write(value, out):
+            if value is None:
+                out.append(encode(serialize(value)))
+                return
+            out.append("[")
+            separator = ""
+            for item in value:
+                out.append(separator)
+                write_item(item, out)
+                separator = ","
+            out.append("]")
+
+        return write
+
+    def compile_dict(self, schema: Dict) -> _Write:
+        serialize = schema.serialize
+        encode = self.encode
+        write_value = self.compile(schema._value)
+
+        def write(value, out):
+            if value is None or not all(isinstance(key, str) for key in value):
+                # 非字符串的键交由 json 模块转换
+                out.append(encode(serialize(value)))
+                return
+            out.append("{")
+            separator = ""
+            for key, val in value.items():
+                out.append(separator + _encode_string(key) + ":")
+                write_value(val, out)
+                separator = ","
+            out.append("}")
+
+        return write
+
+    def compile_model(self, schema: Model) -> _Write:
+        serialize = schema.serialize
+        encode = self.encode
+        fields = tuple(
+            (
+                _encode_string(plan.alias) + ":",
+                plan.attr,
+                plan.required,
+                plan.getter,
+                self.compile(plan.field),
+            )
+            for plan in schema._serialization_plan
+        )
+
+        def write(value, out):
+            if value is None:
+                out.append(encode(serialize(value)))
+                return
+            get = operator.getitem if isinstance(value, Mapping) else getattr
+            out.append("{")
+            separator = ""
+            for key, attr, required, getter, write_field in fields:
+                if getter is not None:
+                    field_value = getter(value)
+                else:
+                    try:
+                        field_value = get(value, attr)
+                    except (KeyError, AttributeError):
+                        if required:
+                            raise
+                        continue
+                if field_value is empty:
+                    continue
+                out.append(separator + key)
+                write_field(field_value, out)
+                separator = ","
+            out.append("}")
+
+        return write
+
+    def compile(self, schema: Schema) -> _Write:
+        if _is_plain(schema, Model):
+            return self.compile_model(t.cast(Model, schema))
+        if _is_plain(schema, List):
+            return self.compile_list(t.cast(List, schema))
+        if _is_plain(schema, Dict):
+            return self.compile_dict(t.cast(Dict, schema))
+        if _is_plain(schema, String):
+            return self.compile_scalar(schema, lambda v: _encode_string(str(v)))
+        if _is_plain(schema, Integer):
+            return self.compile_scalar(schema, lambda v: int.__repr__(int(v)))
+        if _is_plain(schema, Float):
+            return self.compile_scalar(schema, lambda v: _encode_float(float(v)))
+        if _is_plain(schema, Boolean):
+            encode = self.encode
+            return self.compile_scalar(
+                schema,
+                lambda v: "true" if v is True else "false" if v is False else encode(v),
+            )
+        if _is_plain(schema, Datetime):
+            return self.compile_scalar(schema, lambda v: _encode_string(v.isoformat()))
+        return self.compile_fallback(schema)
+
+
+def compile_json_writer(
+    schema, encode: t.Optional[t.Callable[[t.Any], str]] = None
+) -> t.Callable[[t.Any], bytes]:
+    """
+    将数据结构编译为 JSON 写入函数，写入函数接收待序列化的对象，返回 UTF-8 编码的 JSON 字节串。
+
+    `Model <django_oasis.schema.Model>`、`List <django_oasis.schema.List>`、`Dict <django_oasis.schema.Dict>`、
+    `String <django_oasis.schema.String>`、`Integer <django_oasis.schema.Integer>`、`Float <django_oasis.schema.Float>`、
+    `Boolean <django_oasis.schema.Boolean>`、`Datetime <django_oasis.schema.Datetime>` 会被直接编码；重写了序列化方法的子类及其它数据结构仍使用 ``serialize`` 的结果编码。
+
+    :param encode: 编码 ``serialize`` 结果的函数，返回 JSON 字符串，默认使用 ``DjangoJSONEncoder``。
+
+    .. doctest::
+
+        >>> from django_oasis import schema
+        >>> from django_oasis.json_writer import compile_json_writer
+
+        >>> write = compile_json_writer(schema.List(schema.Integer()))
+        >>> write(["1", 2.0])
+        b'[1,2]'
+    """
+    write = _Compiler(encode or _encode).compile(make_instance(schema))
+
+    def writer(value) -> bytes:
+        out: t.List[str] = []
+        write(value, out)
+        return "".join(out).encode()
+
+    return writer
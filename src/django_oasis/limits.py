@@ -0,0 +1,162 @@
+"""
+请求数据的大小及复杂度限制。
+
+全局限制通过 Django 配置项 ``OASIS_REQUEST_LIMITS`` 设置，`Operation <django_oasis.core.Operation>` 的 ``limits`` 参数可以覆盖其中的项::
+
+    OASIS_REQUEST_LIMITS = {
+        "max_body_size": 1024 * 1024,
+        "max_depth": 32,
+        "max_items": 10000,
+        "max_string_length": 10000,
+    }
+
+未设置的项不做限制。请求体的大小由 ``max_body_size`` 限制，JSON 请求体使用配置的 JSON 后端解码后再检查其余各项。
+"""
+
+import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django_oasis.conf import get_setting
+from django_oasis.exceptions import BadRequestError, PayloadTooLargeError
+
+__all__ = ("RequestLimits",)
+
+
+class RequestLimits:
+    """
+    :param max_body_size: 请求体的最大字节数，超出时返回 HTTP 413 响应。
+    :param max_depth: JSON 数据的最大嵌套深度，顶层的数组或对象深度为 1。
+    :param max_items: JSON 数据中数组元素及对象成员的最大总数。
+    :param max_string_length: JSON 数据中字符串 (包括对象的键) 的最大长度。
+    """
+
+    __slots__ = ("max_body_size", "max_depth", "max_items", "max_string_length")
+
+    def __init__(
+        self,
+        *,
+        max_body_size: t.Optional[int] = None,
+        max_depth: t.Optional[int] = None,
+        max_items: t.Optional[int] = None,
+        max_string_length: t.Optional[int] = None,
+    ) -> None:
+        self.max_body_size = max_body_size
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_string_length = max_string_length
+
+    @classmethod
+    def from_settings(cls) -> "RequestLimits":
+        return cls(**get_setting("OASIS_REQUEST_LIMITS"))
+
+    def override(self, other: "RequestLimits") -> "RequestLimits":
+        """返回一个新的对象，``other`` 中设置了的项覆盖当前的项。"""
+        return RequestLimits(
+            **{
+                name: (
+                    getattr(self, name)
+                    if getattr(other, name) is None
+                    else getattr(other, name)
+                )
+                for name in self.__slots__
+            }
+        )
+
+    @property
+    def checks_json(self) -> bool:
+        return (
+            self.max_depth is not None
+            or self.max_items is not None
+            or self.max_string_length is not None
+        )
+
+    def check_content_length(self, request) -> None:
+        """根据请求头的 Content-Length 检查请求体大小，不读取请求体。"""
+        if self.max_body_size is None:
+            return
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            return
+        if content_length > self.max_body_size:
+            raise PayloadTooLargeError
+
+    def check_body_size(self, size: int) -> None:
+        if self.max_body_size is not None and size > self.max_body_size:
+            raise PayloadTooLargeError
+
+    def check_value(self, value, depth: int = 0, items: int = 0) -> int:
+        """
+        检查已解码的 JSON 数据，返回累计的元素总数。
+
+        :param depth: 数据所在的嵌套深度。
+        :param items: 此前已累计的元素总数。
+        """
+        if not self.checks_json:
+            return items
+        max_items = self.max_items
+        max_string_length = self.max_string_length
+        if isinstance(value, str):
+            self.__check_string(value)
+            return items
+        if not isinstance(value, (list, dict)):
+            return items
+        # 解码得到的数据只包含内置类型，使用显式的栈及 type() 比较，元素较多时开销低于解码本身
+        stack = [(value, depth)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            value, depth = pop()
+            depth += 1
+            self.__check_depth(depth)
+            items += len(value)
+            if max_items is not None and items > max_items:
+                raise BadRequestError(
+                    f"Number of items exceeds the limit of {max_items}."
+                )
+            if isinstance(value, dict):
+                if max_string_length is not None:
+                    for key in value:
+                        if len(key) > max_string_length:
+                            self.__check_string(key)
+                value = value.values()
+            for val in value:
+                tp = type(val)
+                if tp is str:
+                    if max_string_length is not None and len(val) > max_string_length:
+                        self.__check_string(val)
+                elif tp is list or tp is dict:
+                    push((val, depth))
+        return items
+
+    def __check_depth(self, depth: int) -> None:
+        if self.max_depth is not None and depth > self.max_depth:
+            raise BadRequestError(
+                f"Nesting depth exceeds the limit of {self.max_depth}."
+            )
+
+    def __check_string(self, value: str) -> None:
+        if self.max_string_length is not None and len(value) > self.max_string_length:
+            raise BadRequestError(
+                f"String length exceeds the limit of {self.max_string_length}."
+            )
+
+
+_current_limits: ContextVar[RequestLimits] = ContextVar(
+    "_current_limits", default=RequestLimits()
+)
+
+
+def get_request_limits() -> RequestLimits:
+    """返回当前解析请求时生效的限制。"""
+    return _current_limits.get()
+
+
+@contextmanager
+def request_limits_context(limits: RequestLimits):
+    token = _current_limits.set(limits)
+    try:
+        yield
+    finally:
+        _current_limits.reset(token)
@@ -0,0 +1,65 @@
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.urls import reverse
+
+from django_oasis.conf import get_setting
+from django_oasis.core import prebuilt_spec_path
+from django_oasis.utils.project import iter_spec_endpoints
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the OAS of every OpenAPI instance found in the URLconf. "
+        "Set OASIS_PREBUILT_SPEC_DIR to the output directory to serve the "
+        "exported JSON files directly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            help="Defaults to the OASIS_PREBUILT_SPEC_DIR setting.",
+        )
+        parser.add_argument(
+            "--format",
+            action="append",
+            choices=["json", "yaml"],
+            help="Output format, can be given more than once. Defaults to json.",
+        )
+
+    def handle(self, *args, output_dir=None, format=None, **options):
+        output_dir = output_dir or get_setting("OASIS_PREBUILT_SPEC_DIR")
+        if not output_dir:
+            raise CommandError(
+                "Specify --output-dir or set OASIS_PREBUILT_SPEC_DIR in settings."
+            )
+
+        formats = format or ["json"]
+        if "yaml" in formats:
+            try:
+                import yaml
+            except ImportError:
+                raise CommandError("PyYAML is required to export YAML files.")
+
+        factory = RequestFactory()
+        for namespaces, view_name, view in iter_spec_endpoints():
+            request = factory.get(reverse(":".join(namespaces + [view_name])))
+            openapi = view.__self__
+            spec = openapi.get_spec(request)
+
+            for fmt in formats:
+                filename = prebuilt_spec_path(output_dir, request.path_info, fmt)
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                if fmt == "json":
+                    content = openapi._dump_spec(spec)
+                else:
+                    content = yaml.safe_dump(
+                        json.loads(openapi._dump_spec(spec)),
+                        allow_unicode=True,
+                        sort_keys=False,
+                    ).encode()
+                with open(filename, "wb") as fp:
+                    fp.write(content)
+                self.stdout.write("Exported %r" % filename)
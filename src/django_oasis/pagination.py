@@ -1,24 +1,39 @@
 import abc
-import copy
+import base64
+import datetime
+import decimal
+import hashlib
+import json
 import typing as t
+import uuid
 
-from django.db.models import QuerySet
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections, models
+from django.db.models import Q, QuerySet
 from django.http import HttpRequest
 from django.utils.functional import cached_property
 
 from django_oasis import schema
+from django_oasis.exceptions import RequestValidationError
 from django_oasis.parameter.parameters import MountPoint, Query, RequestParameter
+from django_oasis.utils.django import QuerySetProjection
 
 
 class Pagination(MountPoint, metaclass=abc.ABCMeta):
     """分页器抽象基类"""
 
-    __reqarg: t.Any
-
     @cached_property
     def __parameter(self):
         return self._get_request_parameter()
 
+    @cached_property
+    def __projection(self) -> t.Optional[QuerySetProjection]:
+        item_schema = self._get_item_schema()
+        return None if item_schema is None else QuerySetProjection(item_schema)
+
     def __openapispec__(self, oas):
         return self.__parameter.__openapispec__(oas)
 
@@ -26,14 +41,31 @@ class Pagination(MountPoint, metaclass=abc.ABCMeta):
         if operation.response_schema is None:
             operation.response_schema = self._get_response_schema()
 
-    def parse_request(self, request: HttpRequest):
-        this = copy.copy(self)  # TODO copy is not good
-        this.__reqarg = self.__parameter.parse_request(request)
-        return this
+    def parse_request(self, request: HttpRequest) -> "BoundPagination":
+        return BoundPagination(self, self.__parameter.parse_request(request))
 
     def paginate(self, queryset: QuerySet):
-        """对 Django 查询集进行分页，并返回结果。"""
-        return self._get_response(queryset, self.__reqarg)
+        """
+        对 Django 查询集进行分页，并返回结果。
+
+        该方法只能在请求操作中调用，分页器在请求时会被替换为 `BoundPagination`。
+        子类可以重写该方法，并通过 ``super().paginate(queryset)`` 调用默认的实现。
+        """
+        if not isinstance(self, BoundPagination):
+            raise RuntimeError(
+                "paginate() can only be called on the pagination bound to a request."
+            )
+        queryset = self._project_queryset(queryset)
+        return self._get_response(queryset, self.reqarg)
+
+    async def apaginate(self, queryset: QuerySet):
+        """`paginate` 的异步版本，在异步请求操作中使用。"""
+        if not isinstance(self, BoundPagination):
+            raise RuntimeError(
+                "apaginate() can only be called on the pagination bound to a request."
+            )
+        queryset = self._project_queryset(queryset)
+        return await self._aget_response(queryset, self.reqarg)
 
     @abc.abstractmethod
     def _get_request_parameter(self) -> RequestParameter:
@@ -52,17 +84,172 @@ class Pagination(MountPoint, metaclass=abc.ABCMeta):
         :param reqarg: 使用 `_get_request_parameter` 返回对象获取到的请求实参。
         """
 
+    async def _aget_response(self, queryset: QuerySet, reqarg):
+        """异步获取响应数据，默认在线程中调用 `_get_response`。"""
+        return await sync_to_async(self._get_response)(queryset, reqarg)
+
+    def _get_item_schema(self) -> t.Optional[schema.Schema]:
+        """分页列表元素的数据结构，用于推导查询集的字段投影。默认返回 `None`，即不进行投影。"""
+        return None
+
+    def _project_queryset(self, queryset: QuerySet, extra_fields=()) -> QuerySet:
+        """
+        在 `paginate` 中调用，根据 `_get_item_schema` 投影查询集，参考 `QuerySetProjection <django_oasis.utils.django.QuerySetProjection>`。
+
+        :param extra_fields: 分页时需要用到的其它字段。
+        """
+        if self.__projection is None:
+            return queryset
+        return self.__projection.apply(queryset, extra_fields)
+
+
+class BoundPagination:
+    """
+    绑定了请求实参的分页器，由 `Pagination.parse_request` 返回，作为请求操作的实参。
+
+    它只保存分页器和请求实参，不会复制分页器。其它属性将从分页器中获取，以兼容自定义分页器：
+    ``isinstance`` 检查的是分页器的类型，``paginate``/``apaginate`` 会以它为 ``self`` 调用分页器类中 (可能被重写) 的方法。
+    """
+
+    __slots__ = ("pagination", "reqarg")
+
+    def __init__(self, pagination: Pagination, reqarg):
+        self.pagination = pagination
+        self.reqarg = reqarg
+
+    # 与 django.utils.functional.LazyObject 相同，使 isinstance 及 super() 将其视为分页器
+    @property  # type: ignore[misc]
+    def __class__(self):
+        return type(self.pagination)
+
+    def __getattr__(self, name: str):
+        return getattr(self.pagination, name)
+
+    def paginate(self, queryset: QuerySet):
+        """对 Django 查询集进行分页，并返回结果。"""
+        return type(self.pagination).paginate(self, queryset)  # type: ignore[arg-type]
+
+    async def apaginate(self, queryset: QuerySet):
+        """`paginate` 的异步版本，在异步请求操作中使用。"""
+        return await type(self.pagination).apaginate(self, queryset)  # type: ignore[arg-type]
+
+
+COUNT_EXACT = "exact"
+COUNT_NONE = "none"
+COUNT_ESTIMATE = "estimate"
+COUNT_CACHED = "cached"
+
+
+class _Counter:
+    """按照计数模式获取查询集的数据总数。"""
+
+    #: 估算值小于该值时改用精确计数，此时精确计数的开销很小，而估算的误差相对较大。
+    estimate_threshold = 1000
+
+    def __init__(self, mode: str, cache_timeout: int):
+        choices = [COUNT_EXACT, COUNT_NONE, COUNT_ESTIMATE, COUNT_CACHED]
+        if mode not in choices:
+            raise ValueError(
+                f'count must be one of {", ".join([repr(i) for i in choices])}.'
+            )
+        self.mode = mode
+        self.cache_timeout = cache_timeout
+
+    def get_fields(self) -> t.Dict[str, schema.Schema]:
+        """分页响应中的计数字段。"""
+        if self.mode == COUNT_NONE:
+            return {}
+        description = {
+            COUNT_ESTIMATE: "数据总数的估算值。",
+            COUNT_CACHED: "数据总数，结果有缓存，可能不是最新的值。",
+        }.get(self.mode)
+        return {"count": schema.Integer(description=description)}
+
+    def count(self, queryset: QuerySet) -> t.Optional[int]:
+        if self.mode == COUNT_NONE:
+            return None
+        if self.mode == COUNT_ESTIMATE:
+            return self.__estimate(queryset)
+        if self.mode == COUNT_CACHED:
+            return self.__cached_count(queryset)
+        return queryset.count()
+
+    async def acount(self, queryset: QuerySet) -> t.Optional[int]:
+        if self.mode == COUNT_NONE:
+            return None
+        if self.mode == COUNT_EXACT:
+            return await queryset.acount()
+        return await sync_to_async(self.count)(queryset)
+
+    def __estimate(self, queryset: QuerySet) -> int:
+        # 只有 PostgreSQL 能从查询计划中得到行数估算，其它数据库使用精确计数。
+        if connections[queryset.db].vendor == "postgresql":
+            try:
+                plan = json.loads(queryset.explain(format="json"))
+                estimate = int(plan[0]["Plan"]["Plan Rows"])
+            except EmptyResultSet:
+                return 0
+            except (ValueError, TypeError, KeyError, IndexError):
+                pass
+            else:
+                if estimate >= self.estimate_threshold:
+                    return estimate
+        return queryset.count()
+
+    def __cached_count(self, queryset: QuerySet) -> int:
+        try:
+            # str(query) 会直接将参数填入 SQL 而不加引号，不同的查询可能得到相同的字符串
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        key = (
+            "django_oasis:count:"
+            + hashlib.md5(f"{queryset.db}:{sql}:{params!r}".encode()).hexdigest()
+        )
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, self.cache_timeout)
+        return count
+
+
+async def _afetch_page(queryset: QuerySet, offset: int, limit: int, counter: _Counter):
+    """
+    获取分页数据及总数。
+
+    Django 的异步 ORM 调用都在同一个线程敏感的执行器中运行，两个查询即使使用 ``asyncio.gather`` 也只会依次执行，
+    因此这里直接按顺序查询。
+    """
+    results = [obj async for obj in queryset[offset : offset + limit]]
+    return results, await counter.acount(queryset)
+
 
 class PagePagination(Pagination):
     """
     从 URL 参数中获取 ``page`` 和 ``page_size`` 进行分页。
 
     :param schema: 提供分页列表元素的数据结构。
+    :param count: 数据总数的计数模式。``"exact"`` (默认) 精确计数；
+        ``"none"`` 不计数，响应中没有 ``count`` 字段；
+        ``"estimate"`` 在 PostgreSQL 中使用查询计划估算总数，其它数据库或估算值较小时使用精确计数；
+        ``"cached"`` 以查询集的 SQL 为键缓存计数结果。
+    :param count_cache_timeout: ``"cached"`` 模式下计数结果的缓存秒数。
     """
 
-    def __init__(self, schema: t.Union[schema.Schema, t.Type[schema.Schema]], /):
+    def __init__(
+        self,
+        schema: t.Union[schema.Schema, t.Type[schema.Schema]],
+        /,
+        *,
+        count: str = COUNT_EXACT,
+        count_cache_timeout: int = 60,
+    ):
         super().__init__()
         self.__schema = schema
+        self.__counter = _Counter(count, count_cache_timeout)
+
+    def _get_item_schema(self):
+        return self.__schema
 
     def _get_request_parameter(self):
         return Query(
@@ -78,7 +265,7 @@ class PagePagination(Pagination):
                 "page": schema.Integer(),
                 "page_size": schema.Integer(),
                 "results": schema.List(self.__schema),
-                "count": schema.Integer(),
+                **self.__counter.get_fields(),
             }
         )()
 
@@ -89,7 +276,18 @@ class PagePagination(Pagination):
             "page": page,
             "page_size": page_size,
             "results": queryset[offset : offset + page_size],
-            "count": queryset.count(),
+            "count": self.__counter.count(queryset),
+        }
+
+    async def _aget_response(self, queryset: QuerySet, reqarg):
+        page, page_size = reqarg["page"], reqarg["page_size"]
+        offset = (page - 1) * page_size
+        results, count = await _afetch_page(queryset, offset, page_size, self.__counter)
+        return {
+            "page": page,
+            "page_size": page_size,
+            "results": results,
+            "count": count,
         }
 
 
@@ -98,11 +296,24 @@ class OffsetPagination(Pagination):
     从 URL 参数中获取 ``offset`` 和 ``limit`` 进行分页。
 
     :param schema:  提供分页列表元素的数据结构。
+    :param count: 数据总数的计数模式，同 `PagePagination`。
+    :param count_cache_timeout: ``"cached"`` 模式下计数结果的缓存秒数。
     """
 
-    def __init__(self, schema: t.Union[schema.Schema, t.Type[schema.Schema]], /):
+    def __init__(
+        self,
+        schema: t.Union[schema.Schema, t.Type[schema.Schema]],
+        /,
+        *,
+        count: str = COUNT_EXACT,
+        count_cache_timeout: int = 60,
+    ):
         super().__init__()
         self.__schema = schema
+        self.__counter = _Counter(count, count_cache_timeout)
+
+    def _get_item_schema(self):
+        return self.__schema
 
     def _get_request_parameter(self):
         return Query(
@@ -118,7 +329,7 @@ class OffsetPagination(Pagination):
                 "offset": schema.Integer(),
                 "limit": schema.Integer(),
                 "results": schema.List(self.__schema),
-                "count": schema.Integer(),
+                **self.__counter.get_fields(),
             }
         )()
 
@@ -128,5 +339,225 @@ class OffsetPagination(Pagination):
             "offset": offset,
             "limit": limit,
             "results": queryset[offset : offset + limit],
-            "count": queryset.count(),
+            "count": self.__counter.count(queryset),
+        }
+
+    async def _aget_response(self, queryset: QuerySet, reqarg):
+        offset, limit = reqarg["offset"], reqarg["limit"]
+        results, count = await _afetch_page(queryset, offset, limit, self.__counter)
+        return {
+            "offset": offset,
+            "limit": limit,
+            "results": results,
+            "count": count,
+        }
+
+
+def _encode_position_value(value):
+    # 不使用 DjangoJSONEncoder，它会将时间截断到毫秒，导致翻页时遗漏或重复数据
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _resolve_column(
+    model: t.Type[models.Model], path: str
+) -> t.Tuple[str, models.Field]:
+    """
+    根据排序字段的查找路径 (如 ``author__name``) 获取模型字段，以及对应数据库列的查找路径。
+
+    外键等关联字段使用其 ``attname`` (如 ``author_id``)，以列值而不是关联对象进行排序、过滤及生成游标。
+    """
+    *relations, name = path.split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+    if not getattr(field, "concrete", False) or field.many_to_many:
+        raise ValueError(f"The ordering field {path!r} must be a concrete field.")
+    if field.is_relation:
+        name = field.attname
+    return "__".join([*relations, name]), field
+
+
+class _Cursor(schema.String):
+    """不透明的游标字符串，反序列化为 (排序字段值列表, 是否向前翻页)。"""
+
+    def __init__(self, *, size: int, **kwargs):
+        super().__init__(**kwargs)
+        self.__size = size
+
+    @staticmethod
+    def encode(position: list, reverse: bool) -> str:
+        data = json.dumps({"p": position, "r": reverse}, default=_encode_position_value)
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def _deserialize(self, value):
+        value = str(value)
+        try:
+            data = json.loads(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)))
+            position, reverse = data["p"], data["r"]
+        except (ValueError, TypeError, KeyError):
+            raise schema.ValidationError("Not a valid cursor.")
+        if (
+            not isinstance(position, list)
+            or len(position) != self.__size
+            or not isinstance(reverse, bool)
+            # 排序字段的值只能是标量，具体的类型在分页时由模型字段验证
+            or not all(v is None or isinstance(v, (str, int, float)) for v in position)
+        ):
+            raise schema.ValidationError("Not a valid cursor.")
+        return position, reverse
+
+    @staticmethod
+    def to_python(position: list, fields: t.Sequence[models.Field]) -> list:
+        """使用模型字段将游标中的值转换回 Python 对象，无效时抛出 `RequestValidationError`。"""
+        try:
+            return [
+                field.get_prep_value(field.to_python(value))
+                for field, value in zip(fields, position)
+            ]
+        except (DjangoValidationError, ValueError, TypeError):
+            error = schema.ValidationError()
+            error.setitem_error("cursor", schema.ValidationError("Not a valid cursor."))
+            raise RequestValidationError(error, "query")
+
+
+class CursorPagination(Pagination):
+    """
+    从 URL 参数中获取 ``cursor`` 和 ``page_size`` 进行游标 (keyset) 分页。
+
+    与 `PagePagination` 和 `OffsetPagination` 不同，它使用排序字段的值进行过滤，而不是 SQL 的 OFFSET，所以翻页的开销不会随着页数增加。
+    但只能逐页向前或向后翻页，也不提供数据总数。
+
+    :param schema: 提供分页列表元素的数据结构。
+    :param ordering: 排序字段，可以是多个，以 "-" 开头表示降序。排序字段的组合必须唯一且值不为空，通常以主键结尾，默认为 ``"pk"``。
+        外键以其列值 (如 ``author_id``) 排序，不支持反向关联及多对多字段。
+    :param page_size: 默认的页面大小。
+    """
+
+    def __init__(
+        self,
+        schema: t.Union[schema.Schema, t.Type[schema.Schema]],
+        /,
+        *,
+        ordering: t.Union[str, t.Sequence[str]] = "pk",
+        page_size: int = 20,
+    ):
+        super().__init__()
+        self.__schema = schema
+        self.__ordering: t.Tuple[str, ...] = (
+            (ordering,) if isinstance(ordering, str) else tuple(ordering)
+        )
+        if not self.__ordering:
+            raise ValueError("ordering cannot be empty.")
+        self.__page_size = page_size
+
+    def _get_item_schema(self):
+        return self.__schema
+
+    def _project_queryset(self, queryset: QuerySet, extra_fields=()) -> QuerySet:
+        # 排序字段的值用于生成游标
+        return super()._project_queryset(
+            queryset, [*extra_fields, *(f.lstrip("-") for f in self.__ordering)]
+        )
+
+    def _get_request_parameter(self):
+        return Query(
+            {
+                "cursor": _Cursor(
+                    size=len(self.__ordering),
+                    required=False,
+                    description="分页游标，取自上一次响应的 next 或 previous。",
+                ),
+                "page_size": schema.Integer(default=self.__page_size, minimum=1),
+            }
+        )
+
+    def _get_response_schema(self) -> schema.Schema:
+        return schema.Model.from_dict(
+            {
+                "results": schema.List(self.__schema),
+                "next": schema.String(nullable=True),
+                "previous": schema.String(nullable=True),
+            }
+        )()
+
+    def __get_ordering(self, model) -> t.List[t.Tuple[str, bool, models.Field]]:
+        """返回 (列的查找路径, 是否降序, 模型字段) 的列表，不考虑翻页方向。"""
+        rv = []
+        for field in self.__ordering:
+            path, model_field = _resolve_column(model, field.lstrip("-"))
+            rv.append((path, field.startswith("-"), model_field))
+        return rv
+
+    def __get_page_queryset(self, queryset: QuerySet, reqarg, ordering):
+        position, reverse = reqarg.get("cursor") or (None, False)
+
+        ordering = [
+            (name, descending != reverse, field) for name, descending, field in ordering
+        ]
+        queryset = queryset.order_by(
+            *(("-" if descending else "") + name for name, descending, _ in ordering)
+        )
+        if position is not None:
+            position = _Cursor.to_python(position, [field for *_, field in ordering])
+            # (a, b) > (x, y) 等价于 a > x OR (a = x AND b > y)
+            condition = Q()
+            for i, (name, descending, _) in enumerate(ordering):
+                q = Q(**{f"{name}__{'lt' if descending else 'gt'}": position[i]})
+                for j in range(i):
+                    q &= Q(**{ordering[j][0]: position[j]})
+                condition |= q
+            queryset = queryset.filter(condition)
+
+        # 多取一条数据，用于判断是否还有下一页
+        return queryset[: reqarg["page_size"] + 1]
+
+    @staticmethod
+    def __get_position(obj, ordering) -> list:
+        rv = []
+        for name, *_ in ordering:
+            value = obj
+            for attr in name.split("__"):
+                value = getattr(value, attr)
+            rv.append(value)
+        return rv
+
+    def __make_response(self, rows: list, reqarg, ordering):
+        position, reverse = reqarg.get("cursor") or (None, False)
+        page_size = reqarg["page_size"]
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        has_next = has_more if not reverse else position is not None
+        has_previous = has_more if reverse else position is not None
+        return {
+            "results": rows,
+            "next": (
+                _Cursor.encode(self.__get_position(rows[-1], ordering), False)
+                if has_next and rows
+                else None
+            ),
+            "previous": (
+                _Cursor.encode(self.__get_position(rows[0], ordering), True)
+                if has_previous and rows
+                else None
+            ),
         }
+
+    def _get_response(self, queryset: QuerySet, reqarg):
+        ordering = self.__get_ordering(queryset.model)
+        rows = list(self.__get_page_queryset(queryset, reqarg, ordering))
+        return self.__make_response(rows, reqarg, ordering)
+
+    async def _aget_response(self, queryset: QuerySet, reqarg):
+        ordering = self.__get_ordering(queryset.model)
+        rows = [
+            obj async for obj in self.__get_page_queryset(queryset, reqarg, ordering)
+        ]
+        return self.__make_response(rows, reqarg, ordering)
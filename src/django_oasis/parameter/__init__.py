@@ -8,6 +8,7 @@ from .parameters import Header as __Header
 from .parameters import HeaderItem as __HeaderItem
 from .parameters import JsonData as __JsonData
 from .parameters import JsonItem as __JsonItem
+from .parameters import JsonStream as __JsonStream
 from .parameters import Query as _Query
 from .parameters import QueryItem as __QueryItem
 from .style import Style
@@ -22,3 +23,4 @@ FormData = _t.cast(_t.Any, __FormData)
 JsonData = _t.cast(_t.Any, __JsonData)
 FormItem = _t.cast(_t.Any, __FormItem)
 JsonItem = _t.cast(_t.Any, __JsonItem)
+JsonStream = _t.cast(_t.Any, __JsonStream)
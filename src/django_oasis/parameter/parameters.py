@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import codecs
 import json
 import re
 import typing as t
@@ -17,6 +18,9 @@ from django_oasis.exceptions import (
     RequestValidationError,
     UnsupportedMediaTypeError,
 )
+from django_oasis.json_backends import get_json_backend
+from django_oasis.limits import RequestLimits, get_request_limits
+from django_oasis_schema.exceptions import fail_fast_context, fail_fast_cv
 from django_oasis_schema.utils import make_model_schema, make_schema
 
 from .style import Style, StyleHandler
@@ -109,6 +113,10 @@ class MountPoint:
     def parse_request(self, request: HttpRequest):
         raise NotImplementedError
 
+    async def aparse_request(self, request: HttpRequest):
+        """在异步视图中代替 `parse_request` 被调用，需要进行 I/O 的挂载点可以覆盖该方法。"""
+        return self.parse_request(request)
+
     def __openapispec__(self, oas):
         raise NotImplementedError
 
@@ -142,6 +150,12 @@ class MountPointSet:
             rv[name] = p.parse_request(request)
         return rv
 
+    async def aparse_request(self, request: HttpRequest):
+        rv = {}
+        for name, p in self.__mountpints.items():
+            rv[name] = await p.aparse_request(request)
+        return rv
+
     def __openapispec__(self, oas):
         rv = {}
         parameters = []
@@ -303,10 +317,163 @@ class JsonData(RequestBodyParameter):
         super().__init__(make_schema(schema))
 
     def _process_request(self, request):
+        body = request.body
+        limits = get_request_limits()
+        limits.check_body_size(len(body))
         try:
-            return json.loads(request.body)
-        except (json.JSONDecodeError, TypeError):
+            data = get_json_backend().loads(body)
+        except (ValueError, TypeError, RecursionError):
             raise BadRequestError("Invalid JSON data.")
+        limits.check_value(data)
+        return data
+
+
+_JSON_WHITESPACE = " \t\n\r"
+
+
+class _SizeLimitedStream:
+    """读取的字节数超出限制时抛出 `PayloadTooLargeError <django_oasis.exceptions.PayloadTooLargeError>`。"""
+
+    def __init__(self, stream, limits: RequestLimits) -> None:
+        self.__stream = stream
+        self.__limits = limits
+        self.__size = 0
+
+    def read(self, size: int) -> bytes:
+        chunk = self.__stream.read(size)
+        self.__size += len(chunk)
+        self.__limits.check_body_size(self.__size)
+        return chunk
+
+
+def _iter_json_array(stream, chunk_size: int) -> t.Iterator[t.Any]:
+    """从类文件对象中增量解析 JSON 数组，逐个生成数组元素，数据无效时抛出 `ValueError`。"""
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, eof
+        if eof:
+            return False
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            buffer += text_decoder.decode(b"", final=True)
+            return False
+        buffer += text_decoder.decode(chunk)
+        return True
+
+    def skip_whitespace(pos: int) -> int:
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return pos
+
+    pos = skip_whitespace(0)
+    if buffer[pos : pos + 1] != "[":
+        raise ValueError("Expecting '['.")
+    pos = skip_whitespace(pos + 1)
+    expect_value = True
+    if buffer[pos : pos + 1] == "]":
+        pos += 1
+        expect_value = False
+
+    while expect_value:
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # 元素不完整，继续读取
+                if not fill():
+                    raise
+                continue
+            while end < len(buffer) and buffer[end] in _JSON_WHITESPACE:
+                end += 1
+            if end < len(buffer) and buffer[end] in ",]":
+                break
+            # 数字等元素需要读到分隔符才能确定已经完整，读取后重新解析
+            if not fill():
+                raise ValueError("Expecting ',' or ']'.")
+
+        delimiter = buffer[end]
+        # 丢弃已解析的数据，保持缓冲区大小不变
+        buffer = buffer[end + 1 :]
+        pos = 0
+        expect_value = delimiter == ","
+        if expect_value:
+            pos = skip_whitespace(0)
+        yield item
+
+    if skip_whitespace(pos) < len(buffer):
+        raise ValueError("Extra data.")
+
+
+class JsonStream(RequestBodyParameter):
+    """
+    用于声明元素为 JSON 数组的请求体，并流式地解析。
+
+    不同于 `JsonData`，它不会读取整个请求体，请求操作得到的是一个生成器，在迭代时从 ``request`` 中增量解析数组元素并逐个反序列化，
+    适合接收大量数据的批量导入。元素反序列化失败时，迭代会抛出带有元素索引的 `RequestValidationError <django_oasis.exceptions.RequestValidationError>`，
+    请求数据不是有效的 JSON 数组时抛出 `BadRequestError <django_oasis.exceptions.BadRequestError>`。在此之前迭代出的元素可能已被处理，必要时请使用数据库事务。
+
+    :param item: 数组元素的数据结构。
+    :param batch_size: 如果设置，生成器将按批次生成元素列表，而不是逐个生成元素。
+    :param chunk_size: 每次从请求中读取的字节数。
+    """
+
+    content_type = "application/json"
+
+    def __init__(
+        self, item, /, *, batch_size: int | None = None, chunk_size: int = 64 * 1024
+    ) -> None:
+        super().__init__(s.List(make_schema(item)))
+        self.__batch_size = batch_size
+        self.__chunk_size = chunk_size
+
+    def parse_request(self, request):
+        if request.content_type != self.content_type:
+            raise UnsupportedMediaTypeError
+        # 元素在请求操作迭代时才被反序列化，此时已离开解析请求的上下文，需要预先获取相关设置
+        items = self.__iter_items(request, get_request_limits(), fail_fast_cv.get())
+        if self.__batch_size is None:
+            return items
+        return self.__iter_batches(items)
+
+    def __iter_items(self, request, limits: RequestLimits, fail_fast: bool):
+        item_schema = self._schema._item
+        stream = request
+        if limits.max_body_size is not None:
+            stream = _SizeLimitedStream(request, limits)
+        index = 0
+        total = 0
+        try:
+            for value in _iter_json_array(stream, self.__chunk_size):
+                # 元素位于顶层数组中，深度为 1
+                total = limits.check_value(value, depth=1, items=total + 1)
+                try:
+                    with fail_fast_context(fail_fast):
+                        item = item_schema.deserialize(value)
+                except s.ValidationError as exc:
+                    error = s.ValidationError()
+                    error.setitem_error(index, exc)
+                    raise RequestValidationError(error, self.location)
+                yield item
+                index += 1
+        except ValueError:
+            raise BadRequestError("Invalid JSON data.")
+
+    def __iter_batches(self, items):
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= self.__batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
 
 ## components
@@ -434,16 +601,20 @@ class MountPointSetWrapper:
         results = self.__mountpointset.parse_request(request)
         return self.__worker.split(results)
 
+    async def aparse_request(self, request: HttpRequest):
+        results = await self.__mountpointset.aparse_request(request)
+        return self.__worker.split(results)
+
     def __openapispec__(self, oas):
         return self.__mountpointset.__openapispec__(oas)
 
 
 def _check_mountpoints(values: t.Iterable[MountPoint | RequestParameterComponent]):
     """
-    FormItem, FormData, JsonItem, JsonData 不可共同存在，
-    且 FormData 或 JsonData 只能存在一个。
+    FormItem, FormData, JsonItem, JsonData, JsonStream 不可共同存在，
+    且 FormData、JsonData 或 JsonStream 只能存在一个。
     """
-    unique_classes = {JsonData, FormData}
+    unique_classes = {JsonData, JsonStream, FormData}
     mutex_classes = {FormItem, JsonItem} | unique_classes
 
     record = None
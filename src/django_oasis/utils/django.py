@@ -1,4 +1,13 @@
+import typing as t
+
+from django.core.exceptions import FieldDoesNotExist
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+from django.db.models import Prefetch, QuerySet
+from django.db.models.query import ModelIterable
+
+if t.TYPE_CHECKING:
+    from django_oasis_schema.schemas import Model
 
 
 class django_validator_wraps:
@@ -37,3 +46,130 @@ class django_validator_wraps:
         c = self._wrapped.__class__
         wrapped = c.__module__ + "." + c.__name__
         return f"<django_validator_wraps: {wrapped}>"
+
+
+class QuerySetProjection:
+    """
+    根据序列化查询集元素的数据结构，推导查询集的字段投影及关联查询。
+
+    - 普通字段使用 ``QuerySet.only`` 只查询会被序列化的字段。
+    - 嵌套 `Model <django_oasis.schema.Model>` 的外键及一对一字段使用 ``select_related``。
+    - 元素为 `Model <django_oasis.schema.Model>` 的 `List <django_oasis.schema.List>` 对多字段使用 ``prefetch_related``，预取的查询集同样会被投影。
+
+    字段使用了 ``as_getter`` 钩子，或者其属性不是 Django 模型字段时，无法得知序列化所需的字段，此时不会使用 ``only``。
+    使用 ``as_getter`` 钩子的字段，如果其属性是关联字段 (如返回 ``obj.tags.all()`` 的 ``tags`` 字段)，仍然会进行关联查询。
+
+    :param schema: 序列化查询集元素的数据结构。
+    """
+
+    def __init__(self, schema) -> None:
+        # 延迟导入，django_oasis.schema 会导入当前模块
+        from django_oasis_schema.utils import make_instance
+
+        self.__schema = make_instance(schema)
+        self.__cache: t.Dict[t.Type[models.Model], _Lookups] = {}
+
+    def apply(self, queryset, extra_fields: t.Iterable[str] = ()):
+        """
+        返回投影后的查询集。非模型实例的查询集 (如调用了 ``values()``)、组合查询集，以及已调用 ``only``/``defer`` 的查询集不会被修改。
+
+        :param extra_fields: ``only`` 需要额外包含的字段，如分页时使用的排序字段。
+        """
+        from django_oasis.conf import get_setting
+
+        if (
+            not isinstance(queryset, QuerySet)
+            or queryset._iterable_class is not ModelIterable
+            or queryset.query.combinator
+            or not get_setting("OASIS_QUERYSET_PROJECTION")
+        ):
+            return queryset
+
+        model = queryset.model
+        if model not in self.__cache:
+            self.__cache[model] = _Lookups.build(self.__schema, model)
+        return self.__cache[model].apply(queryset, extra_fields)
+
+
+class _Lookups:
+    __slots__ = ("only", "select_related", "prefetch_related")
+
+    def __init__(self) -> None:
+        self.only: t.Optional[t.List[str]] = []
+        self.select_related: t.List[str] = []
+        self.prefetch_related: t.List[Prefetch] = []
+
+    @classmethod
+    def build(cls, schema, model: t.Type[models.Model]) -> "_Lookups":
+        from django_oasis_schema.schemas import Model
+
+        lookups = cls()
+        if not isinstance(schema, Model):
+            lookups.only = None
+            return lookups
+        lookups.walk(schema, model, "")
+        return lookups
+
+    def walk(self, schema: "Model", model: t.Type[models.Model], prefix: str):
+        from django_oasis_schema.schemas import List, Model
+
+        for plan in schema._serialization_plan:
+            try:
+                field = model._meta.get_field(plan.attr)
+            except FieldDoesNotExist:
+                field = None
+            if field is None:
+                self.only = None
+                continue
+            if plan.getter is not None:
+                # 无法得知钩子读取了哪些字段，但同名的关联字段仍然可以预先查询
+                self.only = None
+
+            name = prefix + field.name
+            if not field.is_relation:
+                self.add_only(name)
+            elif field.many_to_one or field.one_to_one:
+                if field.concrete:
+                    self.add_only(name)
+                if isinstance(plan.field, Model):
+                    self.select_related.append(name)
+                    self.walk(plan.field, field.related_model, name + "__")
+            elif isinstance(plan.field, List) and isinstance(plan.field._item, Model):
+                related = _Lookups.build(plan.field._item, field.related_model)
+                if field.one_to_many and related.only is not None:
+                    # 预取反向外键时，需要通过外键关联回主对象
+                    related.add_only(field.field.name)
+                self.prefetch_related.append(
+                    Prefetch(
+                        name,
+                        queryset=related.apply(
+                            field.related_model._default_manager.all(), ()
+                        ),
+                    )
+                )
+
+    def add_only(self, name: str):
+        if self.only is not None:
+            self.only.append(name)
+
+    def apply(self, queryset, extra_fields: t.Iterable[str]):
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            # 已手动预取的关联，保留原有的设置
+            existing = {
+                lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+                for lookup in queryset._prefetch_related_lookups
+            }
+            queryset = queryset.prefetch_related(
+                *(p for p in self.prefetch_related if p.prefetch_to not in existing)
+            )
+        if self.only is not None and queryset.query.deferred_loading == (
+            frozenset(),
+            True,
+        ):
+            extra_fields = list(extra_fields)
+            # 跨关联的额外字段可能不在 select_related 中，无法安全地投影
+            if not any("__" in f for f in extra_fields):
+                queryset = queryset.only(*self.only, *extra_fields)
+        return queryset
@@ -1,6 +1,8 @@
 import typing as t
 
-from django_oasis.core import Resource
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from django_oasis.core import OpenAPI, Resource
 
 
 def find_resources(module) -> t.Generator[Resource, None, None]:
@@ -9,3 +11,22 @@ def find_resources(module) -> t.Generator[Resource, None, None]:
         o = Resource.checkout(value)
         if o is not None:
             yield o
+
+
+def iter_spec_endpoints(patterns=None, namespaces=None):
+    """遍历路由中所有的 `OpenAPI.spec_view <django_oasis.core.OpenAPI.spec_view>` 端点，生成 (命名空间, 路由名称, 视图)。"""
+    spec_view = OpenAPI.spec_view
+    lookup_str = spec_view.__module__ + "." + spec_view.__qualname__
+
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    namespaces = namespaces or []
+    for pattern in patterns:
+        if isinstance(pattern, URLPattern):
+            if pattern.lookup_str == lookup_str:
+                yield namespaces, pattern.name, pattern.callback
+        elif isinstance(pattern, URLResolver):
+            ns = namespaces.copy()
+            if pattern.namespace:
+                ns.append(pattern.namespace)
+            yield from iter_spec_endpoints(pattern.url_patterns, ns)
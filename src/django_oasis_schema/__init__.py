@@ -1,4 +1,4 @@
 from .constants import __getattr__, empty
-from .exceptions import ValidationError, error_message_context
+from .exceptions import ValidationError, error_message_context, fail_fast_context
 from .hooks import *
 from .schemas import *
@@ -1,101 +1,194 @@
+import math
 import re
 import typing as t
 from decimal import Decimal
 
-from .exceptions import ValidationError
+from .exceptions import ValidationError, fail_fast_cv
 
 
-class OneOf:
-    def __init__(self, choices: t.Iterable):
-        self._choices = choices
+def one_of_validator(choices: t.Iterable) -> t.Callable[[t.Any], None]:
+    """
+    生成验证数值是否为 ``choices`` 之一的函数。
 
-    def __call__(self, value):
-        if value not in self._choices:
-            raise ValidationError(
-                f"The value must be one of {', '.join(repr(e) for e in self._choices)}."
+    可哈希的选项预先存入 frozenset，查找不受选项数量影响；不可哈希的选项 (如列表) 仍逐个比较。
+    错误信息只在首次验证失败时生成。
+    """
+    choices = tuple(choices)
+    hashable = []
+    unhashable = []
+    for choice in choices:
+        try:
+            hash(choice)
+        except TypeError:
+            unhashable.append(choice)
+        else:
+            hashable.append(choice)
+    lookup = frozenset(hashable)
+    message = None
+
+    def check(value):
+        nonlocal message
+        try:
+            if value in lookup:
+                return
+            candidates: t.Sequence = unhashable
+        except TypeError:
+            # 值不可哈希，只能逐个比较
+            candidates = choices
+        if candidates and value in candidates:
+            return
+        if message is None:
+            message = f"The value must be one of {', '.join(repr(e) for e in choices)}."
+        raise ValidationError(message)
+
+    return check
+
+
+def range_validator(
+    *,
+    maximum=None,
+    exclusive_maximum=False,
+    minimum=None,
+    exclusive_minimum=False,
+) -> t.Callable[[t.Any], None]:
+    """
+    根据边界条件生成只包含一次比较的验证函数，错误信息也预先生成。
+
+    验证函数是闭包而不是实现了 ``__call__`` 的对象，调用开销更低。
+    """
+    if minimum is not None and maximum is not None:
+        if not exclusive_minimum and not exclusive_maximum:
+            message = (
+                "The value must be greater than or equal to %s and less than or equal to %s."
+                % (minimum, maximum)
             )
 
+            def check(value):
+                if not (minimum <= value <= maximum):
+                    raise ValidationError(message)
 
-class RangeValidator:
-    def __init__(
-        self,
-        *,
-        maximum=None,
-        exclusive_maximum=False,
-        minimum=None,
-        exclusive_minimum=False,
-    ):
-        self.maximum = maximum
-        self.exclusive_maximum = exclusive_maximum
-        self.minimum = minimum
-        self.exclusive_minimum = exclusive_minimum
-
-    def __call__(self, value):
-        if self.minimum is not None and self.maximum is not None:
-            if not self.exclusive_minimum and not self.exclusive_maximum:
-                if not (self.minimum <= value <= self.maximum):
-                    raise ValidationError(
-                        "The value must be greater than or equal to %s and less than or equal to %s."
-                        % (self.minimum, self.maximum)
-                    )
-            elif self.exclusive_minimum and not self.exclusive_maximum:
-                if not (self.minimum < value <= self.maximum):
-                    raise ValidationError(
-                        "The value must be greater than %s and less than or equal to %s."
-                        % (self.minimum, self.maximum)
-                    )
-            elif not self.exclusive_minimum and self.exclusive_maximum:
-                if not (self.minimum <= value < self.maximum):
-                    raise ValidationError(
-                        "The value must be greater than or equal to %s and less than or equal to %s."
-                        % (self.minimum, self.maximum)
-                    )
-            else:
-                if not (self.minimum < value < self.maximum):
-                    raise ValidationError(
-                        "The value must be greater than %s and less than %s."
-                        % (self.minimum, self.maximum)
-                    )
-        elif self.minimum is not None and self.maximum is None:
-            if not self.exclusive_minimum:
-                if not (self.minimum <= value):
-                    raise ValidationError(
-                        "The value must be greater than or equal to %s." % self.minimum
-                    )
-            else:
-                if not (self.minimum < value):
-                    raise ValidationError(
-                        "The value must be greater than %s." % self.minimum
-                    )
-        elif self.minimum is None and self.maximum is not None:
-            if not self.exclusive_maximum:
-                if not (value <= self.maximum):
-                    raise ValidationError(
-                        "The value must be less than or equal to %s." % self.maximum
-                    )
-            else:
-                if not (value < self.maximum):
-                    raise ValidationError(
-                        "The value must be less than %s" % self.maximum
-                    )
+        elif exclusive_minimum and not exclusive_maximum:
+            message = (
+                "The value must be greater than %s and less than or equal to %s."
+                % (minimum, maximum)
+            )
 
+            def check(value):
+                if not (minimum < value <= maximum):
+                    raise ValidationError(message)
 
-class MultipleOfValidator:
-    def __init__(self, multiple):
-        if multiple <= 0:
-            raise ValueError(
-                'The value of "multipleOf" must be a number, strictly greater than 0'
+        elif not exclusive_minimum and exclusive_maximum:
+            message = (
+                "The value must be greater than or equal to %s and less than or equal to %s."
+                % (minimum, maximum)
             )
 
-        # Decimal 处理浮点数运算
-        self._multiple = Decimal(str(multiple))
+            def check(value):
+                if not (minimum <= value < maximum):
+                    raise ValidationError(message)
 
-    def __call__(self, value) -> None:
-        if Decimal(str(value)) % self._multiple != 0:
-            raise ValidationError(
-                "The value must be a multiple of %s." % self._multiple
+        else:
+            message = "The value must be greater than %s and less than %s." % (
+                minimum,
+                maximum,
             )
 
+            def check(value):
+                if not (minimum < value < maximum):
+                    raise ValidationError(message)
+
+    elif minimum is not None:
+        if not exclusive_minimum:
+            message = "The value must be greater than or equal to %s." % minimum
+
+            def check(value):
+                if not (minimum <= value):
+                    raise ValidationError(message)
+
+        else:
+            message = "The value must be greater than %s." % minimum
+
+            def check(value):
+                if not (minimum < value):
+                    raise ValidationError(message)
+
+    elif maximum is not None:
+        if not exclusive_maximum:
+            message = "The value must be less than or equal to %s." % maximum
+
+            def check(value):
+                if not (value <= maximum):
+                    raise ValidationError(message)
+
+        else:
+            message = "The value must be less than %s" % maximum
+
+            def check(value):
+                if not (value < maximum):
+                    raise ValidationError(message)
+
+    else:
+
+        def check(value):
+            pass
+
+    return check
+
+
+# 绝对值小于该值的整数值浮点数，其十进制字符串表示就是对应的整数
+_FLOAT_EXACT_INT = 2**53
+
+
+def _decompose_float(value: float) -> t.Tuple[int, int]:
+    """返回 ``(digits, exponent)``，``str(value)`` 表示的十进制数等于 ``digits * 10 ** exponent``。"""
+    mantissa, _, exponent = repr(value).partition("e")
+    integer, _, fraction = mantissa.partition(".")
+    return int(integer + fraction), int(exponent or 0) - len(fraction)
+
+
+def multiple_of_validator(multiple) -> t.Callable[[t.Any], None]:
+    """
+    生成验证数值是否为 ``multiple`` 整数倍的函数。
+
+    结果与 ``Decimal(str(value)) % Decimal(str(multiple)) == 0`` 一致，以 ``str()`` 表示的十进制数进行精确计算：
+    ``multiple`` 预先放大为整数，整数直接取模，浮点数由其字符串表示分解为整数及 10 的指数后取模，
+    只有其它类型 (如 Decimal) 才使用 Decimal 计算。不同于 Decimal，商过大时也不会抛出异常。
+    """
+    if multiple <= 0:
+        raise ValueError(
+            'The value of "multipleOf" must be a number, strictly greater than 0'
+        )
+
+    decimal_multiple = Decimal(str(multiple))
+    message = "The value must be a multiple of %s." % decimal_multiple
+
+    # multiple == scaled_multiple / 10 ** places
+    places = max(0, -t.cast(int, decimal_multiple.as_tuple().exponent))
+    scale = 10**places
+    scaled_multiple = int(decimal_multiple.scaleb(places))
+
+    def check(value):
+        if type(value) is int:
+            if value * scale % scaled_multiple:
+                raise ValidationError(message)
+        elif type(value) is float and math.isfinite(value):
+            if value.is_integer() and -_FLOAT_EXACT_INT < value < _FLOAT_EXACT_INT:
+                remainder = int(value) * scale % scaled_multiple
+            else:
+                # value * scale == digits * 10 ** exponent
+                digits, exponent = _decompose_float(value)
+                exponent += places
+                if exponent >= 0:
+                    remainder = digits * 10**exponent % scaled_multiple
+                else:
+                    remainder = digits % (scaled_multiple * 10**-exponent)
+            if remainder:
+                raise ValidationError(message)
+        elif Decimal(str(value)) % decimal_multiple != 0:
+            raise ValidationError(message)
+
+    return check
+
 
 class RegExpValidator:
     def __init__(self, pattern: t.Union[str, re.Pattern]):
@@ -108,38 +201,94 @@ class RegExpValidator:
             )
 
 
-class LengthValidator:
-    def __init__(
-        self, min_length: t.Optional[int] = None, max_length: t.Optional[int] = None
-    ):
-        if min_length is None and max_length is None:
-            raise ValueError("min_length or max_length cannot both be empty.")
-        self.min_length = min_length
-        self.max_length = max_length
-
-    def __call__(self, value):
-        length = len(value)
-        if self.min_length is not None and self.max_length is not None:
-            if not (self.min_length <= length <= self.max_length):
-                raise ValidationError(
-                    "The length must be between %d and %d."
-                    % (self.min_length, self.max_length)
-                )
-        elif self.min_length is not None:
-            if length < self.min_length:
-                raise ValidationError(
-                    "The length must be greater than or equal to %d." % self.min_length
-                )
-        elif self.max_length is not None:
-            if length > self.max_length:
-                raise ValidationError(
-                    "The length must be less than or equal to %d." % self.max_length
-                )
+def length_validator(
+    min_length: t.Optional[int] = None, max_length: t.Optional[int] = None
+) -> t.Callable[[t.Any], None]:
+    """与 `range_validator` 相同，预先确定比较方式及错误信息。"""
+    if min_length is None and max_length is None:
+        raise ValueError("min_length or max_length cannot both be empty.")
+
+    if min_length is not None and max_length is not None:
+        message = "The length must be between %d and %d." % (min_length, max_length)
+
+        def check(value):
+            if not (min_length <= len(value) <= max_length):
+                raise ValidationError(message)
+
+    elif min_length is not None:
+        message = "The length must be greater than or equal to %d." % min_length
+
+        def check(value):
+            if len(value) < min_length:
+                raise ValidationError(message)
+
+    else:
+        message = "The length must be less than or equal to %d." % max_length
+
+        def check(value):
+            if len(value) > max_length:
+                raise ValidationError(message)
+
+    return check
+
+
+class _Canonical:
+    """标记规范化后的容器类型，避免与元素中原有的元组混淆。"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return "<%s>" % self.name
+
+
+_LIST = _Canonical("list")
+_DICT = _Canonical("dict")
+
+
+def _canonicalize(value):
+    """
+    将字典、列表等不可哈希的数据转换为可哈希的键，转换后的键相等当且仅当原数据相等。
+    无法转换时抛出 `TypeError`。
+    """
+    if isinstance(value, dict):
+        return (_DICT, frozenset((k, _canonicalize(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (_LIST, tuple(_canonicalize(v) for v in value))
+    if isinstance(value, set):
+        return frozenset(value)
+    hash(value)
+    return value
 
 
 def unique_validate(items):
-    unique = []
-    for item in items:
-        if item in unique:
-            raise ValidationError("All of items must be unique.")
-        unique.append(item)
+    # 元素首次出现的索引，优先以元素本身作为键，不可哈希时使用规范化的键
+    seen: t.Dict[t.Any, int] = {}
+    # 无法规范化的元素，只能逐个比较
+    unhashable: t.List[t.Tuple[t.Any, int]] = []
+    error = ValidationError()
+    fail_fast = fail_fast_cv.get()
+
+    for index, item in enumerate(items):
+        try:
+            key = item if item.__hash__ is not None else _canonicalize(item)
+            first = seen.setdefault(key, index)
+        except TypeError:
+            for other, first in unhashable:
+                if other == item:
+                    break
+            else:
+                unhashable.append((item, index))
+                first = index
+        if first != index:
+            error.setitem_error(
+                index, ValidationError("Duplicate of the item at index %d." % first)
+            )
+            if fail_fast:
+                break
+
+    if error._nonempty:
+        error.concat_error(ValidationError("All of items must be unique."))
+        raise error
@@ -6,6 +6,7 @@ from contextvars import ContextVar
 from ._error_messages import DEFAULT_ERROR_MESSAGES
 
 error_message_cv: ContextVar = ContextVar("error_messages")
+fail_fast_cv: ContextVar[bool] = ContextVar("fail_fast", default=False)
 
 
 @contextlib.contextmanager
@@ -17,6 +18,16 @@ def error_message_context(error_messages: dict):
         error_message_cv.reset(token)
 
 
+@contextlib.contextmanager
+def fail_fast_context(enabled: bool = True):
+    """在上下文中反序列化时，遇到第一个错误就停止验证并抛出异常，不再收集其余的错误。"""
+    token = fail_fast_cv.set(enabled)
+    try:
+        yield
+    finally:
+        fail_fast_cv.reset(token)
+
+
 class MessageBuilder:
     def __init__(self, message=None, key=None) -> None:
         assert message is not None or key is not None
@@ -51,6 +62,11 @@ class ValidationError(Exception):
 
     def concat_error(self, error: "ValidationError"):
         self.__message_builders.extend(error.__message_builders)
+        for key, item_error in error.__item_errors.items():
+            if key in self.__item_errors:
+                self.__item_errors[key].concat_error(item_error)
+            else:
+                self.__item_errors[key] = item_error
 
     def setitem_error(self, key: t.Union[str, int], error: "ValidationError"):
         assert key not in self.__item_errors
@@ -6,6 +6,7 @@ import functools
 import inspect
 import operator
 import re
+import sys
 import typing as t
 import warnings
 from collections.abc import Iterable, Mapping
@@ -14,7 +15,7 @@ from dateutil.parser import isoparse
 
 from . import _validators
 from .constants import empty
-from .exceptions import ValidationError
+from .exceptions import ValidationError, fail_fast_cv
 from .utils import make_instance
 from .utils.hook import HookClassMeta, get_hook, iter_hooks
 
@@ -118,13 +119,12 @@ def _check():
         @functools.wraps(method)
         def wrapper(self: "Schema", *args, **kwargs):
             if not self._is_field and hasattr(self, "_check_info"):
-                field_parameters, stact = self._check_info
-                frameinfo = stact[1]
+                field_parameters, filename, lineno = self._check_info
                 warnings.warn_explicit(
                     message=f"{', '.join(repr(x) for x in sorted(field_parameters))} are field parameters, but this schema isn't a field.",
                     category=UserWarning,
-                    filename=frameinfo.filename,
-                    lineno=frameinfo.lineno,
+                    filename=filename,
+                    lineno=lineno,
                 )
             return method(self, *args, **kwargs)
 
@@ -144,6 +144,8 @@ class Schema(metaclass=SchemaMeta):
     :param erase: |AsField| 提供一个在反序列化时使用的函数，接受反序列化前的字段值。如函数返回 `True`，则该字段值将视为未定义。默认将空字符串或仅包含空白字符的字符串视为未定义。
     :param nullable: 执行验证时判断数据是否为 `None`。默认 `False`，表示不可以为 `None`。
     :param description: 为 OAS 提供描述内容。
+    :param fail_fast: 如果为 `True`，反序列化 (包括嵌套的数据结构) 时遇到第一个错误就停止验证并抛出异常，不再收集其余的错误。
+        默认为 `None`，跟随 `fail_fast_context` 的设置。
     :param validators: 用于设置反序列化验证函数。
 
         .. code-block::
@@ -175,7 +177,13 @@ class Schema(metaclass=SchemaMeta):
         # 检查是否在构建非字段 Schema 时使用了字段参数
         received_field_parameters = set(kwargs) & _FIELD_PARAMETERS
         if received_field_parameters:
-            self._check_info = (received_field_parameters, inspect.stack())
+            # 仅记录调用者的位置，inspect.stack() 会读取整个调用栈的源码，开销很大。
+            frame = sys._getframe(1)
+            self._check_info = (
+                received_field_parameters,
+                frame.f_code.co_filename,
+                frame.f_lineno,
+            )
 
         return self
 
@@ -202,6 +210,7 @@ class Schema(metaclass=SchemaMeta):
         erase: t.Optional[t.Callable[[t.Any], bool]] = default_erase,
         error_messages: t.Optional[dict] = None,
         after_deserialization: t.Optional[t.Callable] = None,
+        fail_fast: t.Optional[bool] = None,
     ):
         self._model: t.Optional[Model] = None
         self.__name = None
@@ -230,10 +239,11 @@ class Schema(metaclass=SchemaMeta):
             self._erase = erase
 
         self.__after_deserialization = after_deserialization
+        self._fail_fast = fail_fast
 
         self._validators = validators or []
         if choices is not None:
-            self._validators.append(_validators.OneOf((choices)))
+            self._validators.append(_validators.one_of_validator(choices))
 
     @property
     def _name(self) -> str:
@@ -275,6 +285,13 @@ class Schema(metaclass=SchemaMeta):
     @_check()
     def deserialize(self, value):
         """对数据进行反序列化操作。"""
+        if self._fail_fast is not None and self._fail_fast != fail_fast_cv.get():
+            token = fail_fast_cv.set(self._fail_fast)
+            try:
+                return self.deserialize(value)
+            finally:
+                fail_fast_cv.reset(token)
+
         if value is None:
             if self.__nullable:
                 return value
@@ -302,11 +319,14 @@ class Schema(metaclass=SchemaMeta):
             yield from self._validators
 
         error = ValidationError()
+        fail_fast = fail_fast_cv.get()
         for validator in get_validators():
             try:
                 validator(value)
             except ValidationError as exc:
                 error.concat_error(exc)
+                if fail_fast:
+                    break
         if error._nonempty:
             raise error
 
@@ -315,21 +335,6 @@ class Schema(metaclass=SchemaMeta):
 
         return value
 
-    def _get_value(self, data):
-        """获取待序列化的值。"""
-
-        hook = get_hook(self._model, ("as_getter", self._name))
-        if hook:
-            return hook(data)
-
-        get = operator.getitem if isinstance(data, Mapping) else getattr
-        try:
-            return get(data, self._attr)
-        except (KeyError, AttributeError):
-            if self._required:
-                raise
-            return empty
-
     @property
     def _is_field(self):
         return self._model is not None
@@ -391,6 +396,35 @@ class FieldMapping(t.Mapping[str, Schema]):
         return iter(self.__field_dict)
 
 
+class _FieldPlan:
+    """预先解析的字段参数，由 `Model` 编译生成，避免每次序列化/反序列化时重复解析字段属性。"""
+
+    __slots__ = (
+        "field",
+        "alias",
+        "attr",
+        "required",
+        "erase",
+        "default",
+        "default_is_callable",
+        "getter",
+        "serialize",
+        "deserialize",
+    )
+
+    def __init__(self, field: Schema):
+        self.field = field
+        self.alias = field._alias
+        self.attr = field._attr
+        self.required = field._required
+        self.erase = field._erase
+        self.default = field._default
+        self.default_is_callable = callable(field._default)
+        self.getter = get_hook(field._model, ("as_getter", field._name))
+        self.serialize = field.serialize
+        self.deserialize = field.deserialize
+
+
 class ModelMeta(SchemaMeta):
     _fields: FieldMapping
 
@@ -518,42 +552,57 @@ class Model(Schema, metaclass=ModelMeta):
 
         return InnerSchema
 
+    @functools.cached_property
+    def _field_plans(self) -> t.Tuple[_FieldPlan, ...]:
+        """编译字段计划，每个 Model 实例仅执行一次。"""
+        return tuple(_FieldPlan(field) for field in self._fields.values())
+
+    @functools.cached_property
+    def _deserialization_plan(self) -> t.Tuple[_FieldPlan, ...]:
+        return tuple(p for p in self._field_plans if not p.field.read_only)
+
+    @functools.cached_property
+    def _serialization_plan(self) -> t.Tuple[_FieldPlan, ...]:
+        return tuple(p for p in self._field_plans if not p.field.write_only)
+
     def _deserialize(self, value: dict):
         data = copy.copy(value)
         del value
 
         rv = {}
         error = ValidationError()
+        fail_fast = fail_fast_cv.get()
 
-        for field in self._fields.values():
-            if field.read_only:
-                continue
-
+        for plan in self._deserialization_plan:
             try:
-                val = data.pop(field._alias)
+                val = data.pop(plan.alias)
             except KeyError:
                 val = empty
             else:
-                if field._erase is not None and field._erase(val):
+                if plan.erase is not None and plan.erase(val):
                     val = empty
 
             if val is empty:
-                if field._required:
+                if plan.required:
                     error.setitem_error(
-                        field._alias,
-                        field._create_validation_error(key="required"),
+                        plan.alias,
+                        plan.field._create_validation_error(key="required"),
                     )
+                    if fail_fast:
+                        raise error
 
-                default = field._default
+                default = plan.default
                 if default is not empty:
-                    rv[field._attr] = default() if callable(default) else default
+                    rv[plan.attr] = default() if plan.default_is_callable else default
 
                 continue
 
             try:
-                rv[field._attr] = field.deserialize(val)
+                rv[plan.attr] = plan.deserialize(val)
             except ValidationError as exc:
-                error.setitem_error(field._alias, exc)  # type: ignore
+                error.setitem_error(plan.alias, exc)  # type: ignore
+                if fail_fast:
+                    raise error
 
         if self._unknown_fields == EXCLUDE:
             pass
@@ -562,6 +611,8 @@ class Model(Schema, metaclass=ModelMeta):
         elif self._unknown_fields == ERROR and data:
             for key in data:
                 error.setitem_error(key, ValidationError("Unknown field."))
+                if fail_fast:
+                    break
 
         if error._nonempty:
             raise error
@@ -570,16 +621,20 @@ class Model(Schema, metaclass=ModelMeta):
 
     def _serialize(self, value):
         rv = {}
-        for field in self._fields.values():
-            if field.write_only:
-                continue
-            field_value = field._get_value(value)
+        get = operator.getitem if isinstance(value, Mapping) else getattr
+        for plan in self._serialization_plan:
+            if plan.getter is not None:
+                field_value = plan.getter(value)
+            else:
+                try:
+                    field_value = get(value, plan.attr)
+                except (KeyError, AttributeError):
+                    if plan.required:
+                        raise
+                    continue
             if field_value is empty:
                 continue
-            try:
-                rv[field._alias] = field.serialize(field_value)
-            except Exception as exc:
-                raise exc
+            rv[plan.alias] = plan.serialize(field_value)
 
         return rv
 
@@ -659,7 +714,9 @@ class String(Schema):
 
         # length
         if min_length is not None or max_length is not None:
-            self._validators.append(_validators.LengthValidator(min_length, max_length))
+            self._validators.append(
+                _validators.length_validator(min_length, max_length)
+            )
 
     def _deserialize(self, value) -> str:
         return str(value)
@@ -696,7 +753,7 @@ class Number(Schema):
         self.__exclusive_minimum = exclusive_minimum
         if any(i is not None for i in (maximum, minimum)):
             self._validators.append(
-                _validators.RangeValidator(
+                _validators.range_validator(
                     maximum=maximum,
                     exclusive_maximum=exclusive_maximum,
                     minimum=minimum,
@@ -706,7 +763,9 @@ class Number(Schema):
 
         self._multiple_of = multiple_of
         if multiple_of is not None:
-            self._validators.append(_validators.MultipleOfValidator(self._multiple_of))
+            self._validators.append(
+                _validators.multiple_of_validator(self._multiple_of)
+            )
 
     def __openapispec__(self, oas, **_):
         return super().__openapispec__(
@@ -754,6 +813,71 @@ class Boolean(Schema):
         data_type = "boolean"
 
 
+# RFC 3339 及常见的 ISO 8601 格式，超过 6 位的小数秒与 isoparse 一样被截断。
+# 时、分、秒及时区偏移限定在有效范围内，超出范围的值 (如 24:00、+05:60) 以及小写的 z 交由 isoparse 处理。
+_ISO_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ]([01]\d|2[0-3]):([0-5]\d)(?::([0-5]\d)(?:[.,](\d{1,6})\d*)?)?"
+    r"(?:(Z)|([+-])([01]\d|2[0-3])(?::?([0-5]\d))?)?)?",
+    re.ASCII,
+)
+
+_UTC = datetime.timezone.utc
+
+
+def _build_datetime(match: re.Match) -> datetime.datetime:
+    (
+        year,
+        month,
+        day,
+        hour,
+        minute,
+        second,
+        fraction,
+        utc,
+        sign,
+        offset_hour,
+        offset_minute,
+    ) = match.groups()
+    tzinfo: t.Optional[datetime.tzinfo] = None
+    if utc:
+        tzinfo = _UTC
+    elif sign:
+        offset = datetime.timedelta(
+            hours=int(offset_hour), minutes=int(offset_minute or 0)
+        )
+        tzinfo = datetime.timezone(-offset if sign == "-" else offset)
+    return datetime.datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour or 0),
+        int(minute or 0),
+        int(second or 0),
+        int(fraction.ljust(6, "0")) if fraction else 0,
+        tzinfo=tzinfo,
+    )
+
+
+def _parse_isoformat(value) -> datetime.datetime:
+    """
+    解析 ISO 8601 日期时间字符串。
+
+    符合预编译正则表达式的常见格式，在 Python 3.11+ 中使用 ``datetime.fromisoformat``，更早的版本根据匹配结果直接构建；
+    其它格式 (如周日期、24:00 等) 以及无法构建的值才使用较慢的 ``dateutil.parser.isoparse``，解析结果与其一致。
+    ``datetime.fromisoformat`` 只用于已匹配的字符串，因为它接受一些 isoparse 会拒绝的格式。
+    """
+    match = _ISO_DATETIME.fullmatch(value) if isinstance(value, str) else None
+    if match is not None:
+        try:
+            if sys.version_info >= (3, 11):
+                return datetime.datetime.fromisoformat(value)
+            return _build_datetime(match)
+        except ValueError:
+            pass
+    return isoparse(value)
+
+
 class Datetime(Schema):
     """
     :param with_tz: 仅反序列可用，如果为 `True` 要求反序列所得 datetime 对象必须包含时区；如果为 `False` 则不能包含时区。默认为 `None`，不做时区要求。
@@ -769,7 +893,7 @@ class Datetime(Schema):
 
     def _deserialize(self, value: str) -> datetime.datetime:
         try:
-            dt = isoparse(value)
+            dt = _parse_isoformat(value)
         except (ValueError, TypeError):
             raise ValidationError("Not a valid datetime string.")
 
@@ -790,7 +914,7 @@ class Date(Schema):
         data_format = "date"
 
     def _deserialize(self, value) -> datetime.date:
-        return isoparse(value).date()
+        return _parse_isoformat(value).date()
 
 
 class Any(Schema):
@@ -850,19 +974,22 @@ class List(Schema):
         self.__unique_items = unique_items
         self._item: Schema = make_instance(item or Any)
         if max_items is not None or min_items is not None:
-            self._validators.append(_validators.LengthValidator(min_items, max_items))
+            self._validators.append(_validators.length_validator(min_items, max_items))
         if unique_items:
             self._validators.append(_validators.unique_validate)
 
     def _deserialize(self, value):
         rv = []
         error = ValidationError()
+        fail_fast = fail_fast_cv.get()
 
         for index, item in enumerate(value):
             try:
                 rv.append(self._item.deserialize(item))
             except ValidationError as exc:
                 error.setitem_error(index, exc)
+                if fail_fast:
+                    break
 
         if error._nonempty:
             raise error
@@ -905,11 +1032,11 @@ class Dict(Schema):
         super().__init__(**kwargs)
         self.__max_properties = max_properties
         self.__min_properties = min_properties
-        self.__value: Schema = make_instance(value or Any)
+        self._value: Schema = make_instance(value or Any)
 
         if min_properties is not None or max_properties is not None:
             self._validators.append(
-                _validators.LengthValidator(min_properties, max_properties)
+                _validators.length_validator(min_properties, max_properties)
             )
 
     def _deserialize(self, obj):
@@ -917,11 +1044,14 @@ class Dict(Schema):
             raise ValidationError("Not a valid dict object.")
         rv = {}
         err = ValidationError()
+        fail_fast = fail_fast_cv.get()
         for key, val in obj.items():
             try:
-                val = self.__value.deserialize(val)
+                val = self._value.deserialize(val)
             except ValidationError as e:
                 err.setitem_error(key, e)
+                if fail_fast:
+                    break
             rv[key] = val
 
         if err._nonempty:
@@ -930,12 +1060,12 @@ class Dict(Schema):
         return rv
 
     def _serialize(self, obj):
-        return {key: self.__value.serialize(val) for key, val in obj.items()}
+        return {key: self._value.serialize(val) for key, val in obj.items()}
 
     def __openapispec__(self, oas, **_) -> dict:
         return super().__openapispec__(
             oas,
-            additionalProperties=(self.__value.__openapispec__(oas)),
+            additionalProperties=(self._value.__openapispec__(oas)),
             maxProperties=self.__max_properties,
             minProperties=self.__min_properties,
         )
@@ -50,6 +50,9 @@ class HookFunction:
 class HookClassMeta(type):
     __schema_hooks__: t.Mapping[t.Hashable, t.List[HookWrapper]]
 
+    # 按 MRO 顺序合并的 hook 索引，在类创建时计算。
+    __schema_hook_index__: t.Mapping[t.Hashable, t.Tuple[HookWrapper, ...]]
+
     def __new__(mcs, classname, bases, attrs: dict):
         hooks_dict: t.Dict[str, t.List[HookWrapper]] = defaultdict(list)
 
@@ -82,7 +85,17 @@ class HookClassMeta(type):
                 )
 
         attrs["__schema_hooks__"] = hooks_dict
-        return super().__new__(mcs, classname, bases, attrs)
+        cls = super().__new__(mcs, classname, bases, attrs)
+
+        index: t.Dict[t.Hashable, t.List[HookWrapper]] = defaultdict(list)
+        for c in cls.__mro__:
+            if isinstance(c, HookClassMeta):
+                for key, hooks in c.__schema_hooks__.items():
+                    index[key].extend(hooks)
+        cls.__schema_hook_index__ = {
+            key: tuple(hooks) for key, hooks in index.items() if hooks
+        }
+        return cls
 
 
 def set_hook(fn: t.Callable[..., t.Any], *args, **kwargs):
@@ -96,16 +109,47 @@ def set_hook(fn: t.Callable[..., t.Any], *args, **kwargs):
     return fn
 
 
+_BOUND_HOOKS_ATTR = "__schema_bound_hooks__"
+
+
+def _get_bound_hooks_cache(bound) -> t.Optional[dict]:
+    """获取实例上缓存的已绑定 hook。实例被复制后，缓存会因 id 不符而失效。"""
+    try:
+        instance_dict = vars(bound)
+    except TypeError:
+        return None
+    cache = instance_dict.get(_BOUND_HOOKS_ATTR)
+    if cache is None or cache[0] != id(bound):
+        cache = (id(bound), {})
+        instance_dict[_BOUND_HOOKS_ATTR] = cache
+    return cache[1]
+
+
+def bound_hooks(bound, key) -> t.Tuple[HookWrapper, ...]:
+    if inspect.isclass(bound):
+        hooks = getattr(bound, "__schema_hook_index__", {}).get(key)
+        if not hooks:
+            return ()
+        return tuple(hook.bind(bound) for hook in hooks)
+
+    hooks = getattr(type(bound), "__schema_hook_index__", {}).get(key)
+    if not hooks:
+        return ()
+
+    cache = _get_bound_hooks_cache(bound)
+    if cache is None:
+        return tuple(hook.bind(bound) for hook in hooks)
+    try:
+        return cache[key]
+    except KeyError:
+        rv = cache[key] = tuple(hook.bind(bound) for hook in hooks)
+        return rv
+
+
 def get_hook(bound, key) -> t.Optional[HookWrapper]:
-    for hook in iter_hooks(bound, key):
-        return hook
-    return None
-
-
-def iter_hooks(bound, key) -> t.Generator[HookWrapper, None, None]:
-    cls = bound if inspect.isclass(bound) else type(bound)
-    for c in inspect.getmro(cls):
-        if isinstance(c, HookClassMeta):
-            c = t.cast(HookClassMeta, c)
-            for hook in c.__schema_hooks__[key]:
-                yield hook.bind(bound)
+    hooks = bound_hooks(bound, key)
+    return hooks[0] if hooks else None
+
+
+def iter_hooks(bound, key) -> t.Iterator[HookWrapper]:
+    return iter(bound_hooks(bound, key))
@@ -23,3 +23,69 @@ def test_swagger_ui(client):
 
     response = client.get("/apidocs/")
     assert response.status_code == 200
+
+
+def test_export_apispec(client, settings, tmp_path):
+    from django.core.management import call_command
+
+    call_command("export_apispec", output_dir=str(tmp_path))
+    (filename,) = tmp_path.rglob("*.json")
+    url = "/" + filename.relative_to(tmp_path).with_suffix("").as_posix()
+
+    response = client.get(url)
+    assert filename.read_bytes() == response.content
+
+    # 直接读取预先导出的文件
+    filename.write_bytes(b'{"prebuilt": true}')
+    settings.OASIS_PREBUILT_SPEC_DIR = str(tmp_path)
+    response = client.get(url)
+    assert response.json() == {"prebuilt": True}
+    assert response.has_header("ETag")
+
+
+@pytest.mark.parametrize(
+    "fail_fast, setting, errors", [(None, False, 2), (None, True, 1), (False, True, 2)]
+)
+def test_operation_fail_fast(rf, settings, get_view, fail_fast, setting, errors):
+    import json
+
+    from django_oasis import schema
+    from django_oasis.core import Operation, Resource
+    from django_oasis.parameter import Query
+
+    settings.OASIS_FAIL_FAST = setting
+    settings.MIDDLEWARE = []
+
+    @Resource("/")
+    class API:
+        @Operation(fail_fast=fail_fast)
+        def get(self, query=Query({"a": schema.Integer(), "b": schema.Integer()})): ...
+
+    response = get_view(API)(rf.get("/?a=x&b=y"))
+    assert response.status_code == 400
+    assert len(json.loads(response.content)["validation_errors"]) == errors
+
+
+@pytest.mark.parametrize("fail_fast, errors", [(False, 2), (True, 1)])
+def test_operation_fail_fast_json_stream(rf, settings, get_view, fail_fast, errors):
+    import json
+
+    from django_oasis import schema
+    from django_oasis.core import Operation, Resource
+    from django_oasis.parameter import JsonStream
+
+    settings.MIDDLEWARE = []
+
+    @Resource("/")
+    class API:
+        @Operation(fail_fast=fail_fast)
+        def post(
+            self, items=JsonStream({"a": schema.Integer(), "b": schema.Integer()})
+        ):
+            # 元素在迭代时才被反序列化
+            list(items)
+
+    request = rf.post("/", b'[{"a": "x", "b": "y"}]', content_type="application/json")
+    response = get_view(API)(request)
+    assert response.status_code == 400
+    assert len(json.loads(response.content)["validation_errors"]) == errors
@@ -0,0 +1,12 @@
+import pytest
+
+
+@pytest.fixture
+def get_view():
+    from django_oasis.core import OpenAPI, Resource
+
+    def get_view(klass):
+        OpenAPI().add_resource(klass)
+        return Resource.checkout(klass).view_func
+
+    return get_view
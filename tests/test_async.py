@@ -0,0 +1,140 @@
+import inspect
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from django_oasis import schema
+from django_oasis.auth import BaseAuth
+from django_oasis.core import Operation, Resource
+from django_oasis.exceptions import UnauthorizedError
+from django_oasis.parameter import Query
+
+
+def test_async_view(rf, get_view):
+    @Resource("/")
+    class API:
+        @Operation(response_schema={"q": schema.String()})
+        async def get(self, query=Query({"q": schema.String()})):
+            return query
+
+        def post(self):
+            return "sync"
+
+    view = get_view(API)
+    assert inspect.iscoroutinefunction(view)
+    assert view.csrf_exempt
+
+    response = async_to_sync(view)(rf.get("/?q=a"))
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"q": "a"}
+
+    # 同一资源中的同步处理方法在线程中执行
+    response = async_to_sync(view)(rf.post("/"))
+    assert response.content == b"sync"
+
+
+def test_sync_view(rf, get_view):
+    @Resource("/")
+    class API:
+        def get(self): ...
+
+    assert not inspect.iscoroutinefunction(get_view(API))
+
+
+class AsyncAuth(BaseAuth):
+    async def check_auth(self, request):
+        if "token" not in request.GET:
+            raise UnauthorizedError
+
+
+def test_async_auth(rf, get_view):
+    @Resource("/")
+    class AsyncAPI:
+        @Operation(auth=AsyncAuth)
+        async def get(self):
+            return "ok"
+
+    @Resource("/")
+    class SyncAPI:
+        @Operation(auth=AsyncAuth)
+        def get(self):
+            return "ok"
+
+    for view in (async_to_sync(get_view(AsyncAPI)), get_view(SyncAPI)):
+        with pytest.raises(UnauthorizedError):
+            view(rf.get("/"))
+        assert view(rf.get("/?token=1")).content == b"ok"
+
+
+@pytest.mark.django_db
+def test_async_view_lazy_queryset(rf, get_view):
+    from samples.pagination.models import Book
+
+    Book.objects.create(title="三体", author="刘慈欣")
+
+    @Resource("/")
+    class API:
+        @Operation(
+            response_schema=schema.List(
+                schema.Model.from_dict({"title": schema.String()})
+            )
+        )
+        async def get(self):
+            return Book.objects.all()  # 未求值的 QuerySet 将在线程中序列化
+
+    response = async_to_sync(get_view(API))(rf.get("/"))
+    assert json.loads(response.content) == [{"title": "三体"}]
+
+
+@pytest.mark.django_db
+def test_async_pagination(rf, get_view):
+    from samples.pagination.models import Book
+
+    from django_oasis.common import model2schema
+    from django_oasis.pagination import OffsetPagination, PagePagination
+
+    Book.objects.bulk_create([Book(title="三体", author="刘慈欣")] * 5)
+
+    @Resource("/")
+    class API:
+        async def get(self, pagination=PagePagination(model2schema(Book))):
+            return await pagination.apaginate(Book.objects.order_by("id"))
+
+        async def post(self, pagination=OffsetPagination(model2schema(Book))):
+            return await pagination.apaginate(Book.objects.order_by("id"))
+
+    view = async_to_sync(get_view(API))
+
+    data = json.loads(view(rf.get("/?page=2&page_size=2")).content)
+    assert data["count"] == 5
+    assert [r["title"] for r in data["results"]] == ["三体"] * 2
+    assert (data["page"], data["page_size"]) == (2, 2)
+
+    data = json.loads(view(rf.post("/?offset=4&limit=2")).content)
+    assert (data["count"], len(data["results"])) == (5, 1)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("count", ["exact", "estimate", "cached", "none"])
+def test_async_pagination_same_as_sync(rf, get_view, count):
+    from samples.pagination.models import Book
+
+    from django_oasis.common import model2schema
+    from django_oasis.pagination import OffsetPagination
+
+    Book.objects.bulk_create([Book(title=str(i), author="刘慈欣") for i in range(5)])
+    pagination = OffsetPagination(model2schema(Book), count=count)
+
+    @Resource("/")
+    class API:
+        def get(self, pagination=pagination):
+            return pagination.paginate(Book.objects.order_by("id"))
+
+        async def post(self, pagination=pagination):
+            return await pagination.apaginate(Book.objects.order_by("id"))
+
+    view = async_to_sync(get_view(API))
+    for query in ("?offset=1&limit=3", "?offset=4&limit=3", "?offset=9"):
+        expected = json.loads(view(rf.get("/" + query)).content)
+        assert json.loads(view(rf.post("/" + query)).content) == expected
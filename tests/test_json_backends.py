@@ -0,0 +1,68 @@
+import datetime
+import decimal
+
+import pytest
+from django.test import RequestFactory
+
+from django_oasis import json_backends, schema
+from django_oasis.parameter import JsonData
+
+BACKENDS = ["stdlib", "orjson", "msgspec"]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, settings):
+    if request.param != "stdlib":
+        pytest.importorskip(request.param)
+    settings.OASIS_JSON_BACKEND = request.param
+    return json_backends.get_json_backend()
+
+
+def test_dumps_and_loads(backend):
+    data = {"a": [1, 2.5, None, True], "b": "中文"}
+    assert backend.loads(backend.dumps(data)) == data
+    assert backend.loads(backend.dumps(data, pretty=True)) == data
+    assert b'\n  "a"' in backend.dumps(data, pretty=True)
+
+    # DjangoJSONEncoder 支持的类型
+    assert backend.loads(backend.dumps(decimal.Decimal("1.5"))) == "1.5"
+    assert backend.loads(backend.dumps(datetime.date(2020, 1, 1))) == "2020-01-01"
+
+    with pytest.raises(ValueError):
+        backend.loads(b"{invalid")
+
+
+@pytest.mark.parametrize("data", [{1: "a", "b": {2: None}}, [2**70, -(2**64)]])
+def test_dumps_parity(backend, data):
+    stdlib = json_backends.StdlibJSONBackend()
+    assert backend.loads(backend.dumps(data)) == stdlib.loads(stdlib.dumps(data))
+    assert backend.loads(backend.dumps(data, pretty=True)) == stdlib.loads(
+        stdlib.dumps(data)
+    )
+
+
+def test_json_data(backend):
+    parameter = JsonData({"a": schema.Integer()})
+    request = RequestFactory().post("/", b'{"a": 1}', content_type="application/json")
+    assert parameter.parse_request(request) == {"a": 1}
+
+
+def test_fallback(settings, monkeypatch):
+    monkeypatch.setattr(json_backends.OrjsonBackend, "is_available", lambda: False)
+    json_backends._load_backend.cache_clear()
+    settings.OASIS_JSON_BACKEND = "orjson"
+    try:
+        with pytest.warns(RuntimeWarning):
+            backend = json_backends.get_json_backend()
+        assert isinstance(backend, json_backends.StdlibJSONBackend)
+    finally:
+        json_backends._load_backend.cache_clear()
+
+
+def test_custom_backend(settings):
+    settings.OASIS_JSON_BACKEND = "django_oasis.json_backends.StdlibJSONBackend"
+    assert isinstance(json_backends.get_json_backend(), json_backends.StdlibJSONBackend)
+
+    settings.OASIS_JSON_BACKEND = "json.JSONEncoder"
+    with pytest.raises(TypeError):
+        json_backends.get_json_backend()
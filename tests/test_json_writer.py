@@ -0,0 +1,90 @@
+import datetime
+import json
+
+import pytest
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_oasis import schema
+from django_oasis.json_writer import compile_json_writer
+from django_oasis_schema.utils import make_instance
+
+
+class Author(schema.Model):
+    name = schema.String()
+
+
+class Book(schema.Model):
+    id = schema.Integer()
+    title = schema.String(alias="Title")
+    price = schema.Float()
+    published = schema.Datetime()
+    on_sale = schema.Boolean()
+    tags = schema.List(schema.String())
+    stock = schema.Dict(schema.Integer())
+    author = Author(nullable=True)
+    note = schema.String(required=False)
+    extra = schema.Any(nullable=True)
+    summary = schema.String()
+
+    @schema.as_getter(summary)
+    def get_summary(self, obj):
+        return "%s by %s" % (obj["title"], obj["author"] and obj["author"]["name"])
+
+
+class Upper(schema.String):
+    def _serialize(self, value):
+        return str(value).upper()
+
+
+BOOKS = [
+    {
+        "id": "1",
+        "title": '三体 "1"',
+        "price": 1,
+        "published": datetime.datetime(2008, 1, 1, 8, 30, 15, 123),
+        "on_sale": True,
+        "tags": ["科幻"],
+        "stock": {"北京": 1.0},
+        "author": {"name": "刘慈欣"},
+        "extra": {"nested": [1, None]},
+    },
+    {
+        "id": 2,
+        "title": "活着",
+        "price": float("inf"),
+        "published": datetime.datetime(1993, 1, 1),
+        "on_sale": 0,
+        "tags": [],
+        "stock": {},
+        "author": None,
+        "note": "",
+        "extra": None,
+    },
+]
+
+
+@pytest.mark.parametrize(
+    "schema_obj, value",
+    [
+        (schema.List(Book), BOOKS),
+        (Book, BOOKS[0]),
+        (schema.Dict(schema.Integer()), {1: 1, "a": 2}),
+        (schema.List(Upper()), ["a", "b"]),
+        (schema.List(schema.Integer(nullable=True)), [1, None]),
+        (schema.String(), "中文"),
+    ],
+)
+def test_same_as_serialize(schema_obj, value):
+    expected = json.dumps(
+        make_instance(schema_obj).serialize(value), cls=DjangoJSONEncoder
+    )
+    assert json.loads(compile_json_writer(schema_obj)(value)) == json.loads(expected)
+
+
+def test_errors():
+    write = compile_json_writer(schema.List(Book))
+    with pytest.raises(KeyError):
+        write([{}])
+
+    with pytest.raises(ValueError, match="The field 'name' cannot be None."):
+        compile_json_writer(Author)({"name": None})
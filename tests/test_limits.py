@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from django_oasis import schema
+from django_oasis.core import Operation, Resource
+from django_oasis.exceptions import BadRequestError
+from django_oasis.limits import RequestLimits
+from django_oasis.parameter import JsonData, JsonStream
+
+
+@pytest.mark.parametrize(
+    "limits, data, message",
+    [
+        ({"max_depth": 2}, [[1, [2]]], "Nesting depth exceeds the limit of 2."),
+        ({"max_depth": 2}, {"a": {"b": []}}, "Nesting depth exceeds the limit of 2."),
+        ({"max_items": 3}, [1, [2, 3]], "Number of items exceeds the limit of 3."),
+        (
+            {"max_items": 2},
+            {"a": 1, "b": {"c": 2}},
+            "Number of items exceeds the limit of 2.",
+        ),
+        ({"max_string_length": 3}, ["abcd"], "String length exceeds the limit of 3."),
+        (
+            {"max_string_length": 3},
+            {"abcd": 1},
+            "String length exceeds the limit of 3.",
+        ),
+    ],
+)
+def test_check_value(limits, data, message):
+    with pytest.raises(BadRequestError) as e:
+        RequestLimits(**limits).check_value(data)
+    assert e.value.args == (message,)
+
+
+@pytest.mark.parametrize(
+    "data, items",
+    [
+        ("[[], {}, [ ], {  }]", 4),
+        ('[["a,b"], {"abcde": "[[["}]', 4),
+        ('["\\u4e2d\\u6587", "中文"]', 2),
+    ],
+)
+def test_check_value_within_limits(data, items):
+    limits = RequestLimits(max_depth=2, max_items=4, max_string_length=5)
+    assert limits.check_value(json.loads(data)) == items
+
+
+def test_override():
+    limits = RequestLimits(max_depth=2, max_items=10).override(
+        RequestLimits(max_items=5)
+    )
+    assert (limits.max_depth, limits.max_items, limits.max_body_size) == (2, 5, None)
+
+
+@pytest.fixture
+def call(rf, settings, get_view):
+    settings.MIDDLEWARE = []
+
+    def call(API, data: bytes):
+        return get_view(API)(rf.post("/", data, content_type="application/json"))
+
+    return call
+
+
+def test_operation_limits(call, settings):
+    settings.OASIS_REQUEST_LIMITS = {"max_body_size": 10, "max_depth": 1}
+
+    @Resource("/")
+    class API:
+        @Operation(limits={"max_body_size": 100})
+        def post(self, body=JsonData(schema.Any())):
+            return body
+
+    assert call(API, b"[1, 2]").status_code == 200
+    assert call(API, b"[1, [2]]").status_code == 400
+    assert call(API, b"[%s]" % b"1," * 50 + b"1").status_code == 413
+
+
+def test_json_stream_limits(call, settings):
+    settings.OASIS_REQUEST_LIMITS = {"max_items": 4}
+
+    @Resource("/")
+    class API:
+        @Operation(response_schema=schema.List(schema.Integer()))
+        def post(self, items=JsonStream(schema.Any(), chunk_size=4)):
+            return [len(item) for item in items]
+
+    assert json.loads(call(API, b"[[1], [2]]").content) == [1, 1]
+    response = call(API, b"[[1], [2, 3]]")
+    assert response.status_code == 400
+    assert b"Number of items exceeds the limit of 4." in response.content
+
+    settings.OASIS_REQUEST_LIMITS = {"max_body_size": 8}
+    assert call(API, b"[[1], [2, 3]]").status_code == 413
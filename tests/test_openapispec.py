@@ -244,3 +244,93 @@ def test_anonymous_model_schema_openapispec(oas):
             },
         },
     }
+
+
+def test_spec_view_cache(rf):
+    import json
+
+    @Resource("/a")
+    class A:
+        def get(self): ...
+
+    @Resource("/b")
+    class B:
+        def get(self): ...
+
+    openapi = OpenAPI()
+    openapi.add_resource(A)
+    response = openapi.spec_view(rf.get("/"))
+    assert response["Content-Type"] == "application/json"
+    assert list(json.loads(response.content)["paths"]) == ["/a"]
+    assert openapi.spec_view(rf.get("/")).content == response.content
+
+    # 添加资源后缓存失效
+    openapi.add_resource(B)
+    assert list(json.loads(openapi.spec_view(rf.get("/")).content)["paths"]) == [
+        "/a",
+        "/b",
+    ]
+
+
+def test_spec_view_cache_size(rf):
+    import json
+
+    openapi = OpenAPI(description=lambda request: request.GET["d"])
+    cache = openapi._OpenAPI__spec_cache
+    for i in range(OpenAPI.spec_cache_size * 2):
+        response = openapi.spec_view(rf.get("/", {"d": str(i)}))
+        assert json.loads(response.content)["info"]["description"] == str(i)
+        assert len(cache) <= OpenAPI.spec_cache_size
+
+    # 保留最近使用的项
+    openapi.spec_view(rf.get("/", {"d": "8"}))
+    openapi.spec_view(rf.get("/", {"d": "x"}))
+    assert [key[2] for key in cache] == [str(i) for i in range(10, 16)] + ["8", "x"]
+
+
+def test_spec_view_cache_threads(rf):
+    from concurrent.futures import ThreadPoolExecutor
+
+    openapi = OpenAPI(description=lambda request: request.GET["d"])
+
+    def request(i):
+        return openapi.spec_view(rf.get("/", {"d": str(i % 20)})).status_code
+
+    # 多个线程同时淘汰缓存项
+    with ThreadPoolExecutor(8) as executor:
+        assert set(executor.map(request, range(400))) == {200}
+    assert len(openapi._OpenAPI__spec_cache) <= OpenAPI.spec_cache_size
+
+
+def test_spec_view_etag_and_gzip(rf):
+    import gzip
+    import json
+
+    @Resource("/" + "a" * 300)
+    class API:
+        def get(self): ...
+
+    openapi = OpenAPI()
+    openapi.add_resource(API)
+
+    response = openapi.spec_view(rf.get("/"))
+    etag = response["ETag"]
+    assert etag.startswith('W/"')
+    assert not response.has_header("Content-Encoding")
+
+    response = openapi.spec_view(rf.get("/", HTTP_IF_NONE_MATCH=etag))
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+    response = openapi.spec_view(rf.get("/", HTTP_ACCEPT_ENCODING="gzip, deflate"))
+    assert response["Content-Encoding"] == "gzip"
+    assert response["ETag"] == etag
+    assert "/" + "a" * 300 in json.loads(gzip.decompress(response.content))["paths"]
+
+    # q=0 表示不可接受该编码
+    for accept_encoding in ("gzip;q=0", "deflate, *;q=0", "gzip;q=0, *"):
+        response = openapi.spec_view(rf.get("/", HTTP_ACCEPT_ENCODING=accept_encoding))
+        assert not response.has_header("Content-Encoding")
+
+    response = openapi.spec_view(rf.get("/", HTTP_ACCEPT_ENCODING="br;q=0, gzip"))
+    assert response["Content-Encoding"] == "gzip"
@@ -14,6 +14,8 @@ from django_oasis.parameter.parameters import (
     FormItem,
     Header,
     JsonData,
+    JsonItem,
+    JsonStream,
     MountPointSet,
     MountPointSetWrapper,
     Path,
@@ -222,6 +224,45 @@ def test_invalid_json_data(rf):
         )
 
 
+class TestJsonStream:
+    def test_items(self, rf):
+        items = JsonStream(schema.Integer(), chunk_size=3).parse_request(
+            rf.post("/", data="[1, 22,\n 333]", content_type="application/json")
+        )
+        assert list(items) == [1, 22, 333]
+
+    def test_batches(self, rf):
+        batches = JsonStream(schema.Integer(), batch_size=2).parse_request(
+            rf.post("/", data="[1, 2, 3]", content_type="application/json")
+        )
+        assert list(batches) == [[1, 2], [3]]
+
+        batches = JsonStream(schema.Integer(), batch_size=2).parse_request(
+            rf.post("/", data=" [ ] ", content_type="application/json")
+        )
+        assert list(batches) == []
+
+    def test_validation_error(self, rf):
+        items = JsonStream({"a": schema.Integer()}).parse_request(
+            rf.post("/", data='[{"a": 1}, {}]', content_type="application/json")
+        )
+        assert next(items) == {"a": 1}
+        with pytest.raises(RequestValidationError) as e:
+            next(items)
+        assert e.value.location == "body"
+        assert e.value.exc.format_errors() == [
+            {"loc": [1, "a"], "msgs": ["This field is required."]}
+        ]
+
+    @pytest.mark.parametrize("data", ["{}", "[1,", "[1 2]", "[1]x"])
+    def test_invalid_json(self, rf, data):
+        items = JsonStream(schema.Integer()).parse_request(
+            rf.post("/", data=data, content_type="application/json")
+        )
+        with pytest.raises(BadRequestError, match="Invalid JSON data"):
+            list(items)
+
+
 class TestComponentItem:
     def test(self, rf):
         worker = AssemblyWorker(
@@ -263,3 +304,10 @@ def test_check_mountpoints():
         MountPointSetWrapper(
             {"a": JsonData(schema.String()), "b": JsonData(schema.String())}
         )
+
+    with pytest.raises(
+        RuntimeError, match="JsonItem and JsonStream cannot be used together"
+    ):
+        MountPointSetWrapper(
+            {"a": JsonItem(schema.String()), "b": JsonStream(schema.String())}
+        )
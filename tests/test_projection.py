@@ -0,0 +1,108 @@
+import pytest
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+
+from django_oasis import schema
+from django_oasis.utils.django import QuerySetProjection
+
+
+class ContentTypeSchema(schema.Model):
+    app_label = schema.String()
+
+
+class PermissionSchema(schema.Model):
+    codename = schema.String()
+    content_type = ContentTypeSchema()
+
+
+class GroupSchema(schema.Model):
+    name = schema.String()
+    permissions = schema.List(PermissionSchema)
+
+    @schema.as_getter(permissions)
+    def get_permissions(self, obj):
+        return obj.permissions.all()
+
+
+def test_only_and_select_related():
+    queryset = QuerySetProjection(PermissionSchema).apply(Permission.objects.all())
+    assert queryset.query.deferred_loading == (
+        frozenset({"codename", "content_type", "content_type__app_label"}),
+        False,
+    )
+    assert queryset.query.select_related == {"content_type": {}}
+
+
+@pytest.mark.django_db
+def test_prefetch_related(django_assert_num_queries):
+    group = Group.objects.create(name="admin")
+    group.permissions.set(Permission.objects.all()[:3])
+
+    queryset = QuerySetProjection(GroupSchema).apply(Group.objects.all())
+    with django_assert_num_queries(2):
+        data = schema.List(GroupSchema).serialize(queryset)
+    assert len(data[0]["permissions"]) == 3
+
+
+def test_skip_projection(settings):
+    class GetterSchema(schema.Model):
+        codename = schema.String()
+
+        @schema.as_getter(codename)
+        def get_codename(self, obj):
+            return obj.codename
+
+    queryset = QuerySetProjection(GetterSchema).apply(Permission.objects.all())
+    assert queryset.query.deferred_loading == (frozenset(), True)
+
+    # 属性不是模型字段
+    queryset = QuerySetProjection(
+        schema.Model.from_dict({"natural_key": schema.Any()})
+    ).apply(ContentType.objects.all())
+    assert queryset.query.deferred_loading == (frozenset(), True)
+
+    projection = QuerySetProjection(PermissionSchema)
+    queryset = projection.apply(Permission.objects.only("name"))
+    assert queryset.query.deferred_loading == (frozenset({"name"}), False)
+
+    queryset = projection.apply(Permission.objects.values("codename"))
+    assert not queryset.query.select_related
+
+    settings.OASIS_QUERYSET_PROJECTION = False
+    queryset = projection.apply(Permission.objects.all())
+    assert queryset.query.deferred_loading == (frozenset(), True)
+
+
+@pytest.mark.django_db
+def test_pagination_projection(rf):
+    from django_oasis.pagination import CursorPagination, PagePagination
+
+    bound = PagePagination(PermissionSchema).parse_request(rf.get("/"))
+    queryset = bound.paginate(Permission.objects.all())["results"]
+    assert "codename" in queryset.query.deferred_loading[0]
+    assert queryset.query.select_related == {"content_type": {}}
+
+    # 游标分页需要排序字段
+    pagination = CursorPagination(PermissionSchema, ordering=["name", "pk"])
+    queryset = pagination._project_queryset(Permission.objects.all())
+    assert "name" in queryset.query.deferred_loading[0]
+
+
+def test_import_first():
+    # 作为第一个导入的模块时，不能产生循环导入
+    import os
+    import subprocess
+    import sys
+
+    import django_oasis
+
+    src = os.path.dirname(os.path.dirname(django_oasis.__file__))
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from django_oasis.utils.django import django_validator_wraps",
+        ],
+        check=True,
+        env={**os.environ, "PYTHONPATH": src},
+    )
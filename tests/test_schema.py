@@ -287,3 +287,297 @@ def test_field_parameter_warning(recwarn):
         warning.message.args[0]
         == "'attr', 'required' are field parameters, but this schema isn't a field."
     )
+
+
+def test_model_deserialization_plan():
+    class User(schema.Model):
+        id = schema.Integer(read_only=True)
+        name = schema.String(alias="username", attr="name_attr")
+        age = schema.Integer(default=lambda: 18)
+
+    user = User()
+    plan = user._deserialization_plan
+    assert plan is user._deserialization_plan  # 仅编译一次
+    assert [(p.alias, p.attr, p.required) for p in plan] == [
+        ("username", "name_attr", True),
+        ("age", "age", False),
+    ]
+    assert user.deserialize({"id": 1, "username": "x"}) == {
+        "name_attr": "x",
+        "age": 18,
+    }
+
+
+def test_model_serialization_plan():
+    class User(schema.Model):
+        name = schema.String(alias="username")
+        password = schema.String(write_only=True)
+        nickname = schema.String()
+
+        @schema.as_getter(nickname)
+        def get_nickname(self, data):
+            return data["name"].upper()
+
+    user = User()
+    assert [p.alias for p in user._serialization_plan] == ["username", "nickname"]
+    assert user._serialization_plan[1].getter is not None
+    assert schema.List(user).serialize(
+        [{"name": "a", "password": "x"}, {"name": "b", "password": "y"}]
+    ) == [{"username": "a", "nickname": "A"}, {"username": "b", "nickname": "B"}]
+
+
+def test_hook_index():
+    import copy
+
+    from django_oasis_schema.utils.hook import bound_hooks
+
+    class A(schema.String):
+        @schema.as_validator
+        def validate_a(self, value): ...
+
+    class B(A):
+        @schema.as_validator
+        def validate_b(self, value): ...
+
+    assert [h.fn.__name__ for h in B.__schema_hook_index__[("as_validator", None)]] == [
+        "validate_b",
+        "validate_a",
+    ]
+
+    b = B()
+    hooks = bound_hooks(b, ("as_validator", None))
+    assert hooks is bound_hooks(b, ("as_validator", None))  # 绑定结果被缓存
+    assert bound_hooks(b, ("as_validator", "x")) == ()
+
+    b2 = copy.copy(b)
+    assert all(h._bound is b2 for h in bound_hooks(b2, ("as_validator", None)))
+
+
+def test_fail_fast():
+    class Item(schema.Model):
+        a = schema.Integer()
+        b = schema.Integer()
+
+    data = [{"a": "x", "b": "x"}, {}]
+
+    with pytest.raises(schema.ValidationError) as e:
+        schema.List(Item).deserialize(data)
+    assert len(e.value.format_errors()) == 4
+
+    with pytest.raises(schema.ValidationError) as e:
+        schema.List(Item, fail_fast=True).deserialize(data)
+    assert e.value.format_errors() == [
+        {"msgs": ["Not a valid integer."], "loc": [0, "a"]}
+    ]
+
+    with schema.fail_fast_context():
+        with pytest.raises(schema.ValidationError) as e:
+            schema.Dict(schema.Integer()).deserialize({"a": "x", "b": "y"})
+        assert e.value.format_errors() == [
+            {"msgs": ["Not a valid integer."], "loc": ["a"]}
+        ]
+
+        # 验证函数也只收集第一个错误
+        with pytest.raises(schema.ValidationError) as e:
+            schema.Integer(maximum=0, multiple_of=2).deserialize(1)
+        assert len(e.value.format_errors()[0]["msgs"]) == 1
+
+        # 数据结构自身的设置优先
+        with pytest.raises(schema.ValidationError) as e:
+            schema.List(schema.Integer(), fail_fast=False).deserialize(["x", "y"])
+        assert len(e.value.format_errors()) == 2
+
+
+@pytest.mark.parametrize(
+    "data, duplicates",
+    [
+        ([1, 2, 3], {}),
+        ([1, 2, 1, True, 2], {2: 0, 3: 0, 4: 1}),
+        ([{"a": [1]}, [1], {"a": [1]}, (1,)], {2: 0}),
+        ([{"a": 1, "b": 2}, {"b": 2, "a": 1}], {1: 0}),
+        ([[{1}], [frozenset({1})]], {1: 0}),
+        ([(1, []), (1, []), (1, [2])], {1: 0}),
+    ],
+)
+def test_unique_items(data, duplicates):
+    s = schema.List(unique_items=True)
+    if not duplicates:
+        assert s.deserialize(data) == data
+        return
+
+    with pytest.raises(schema.ValidationError) as e:
+        s.deserialize(data)
+    assert e.value.format_errors() == [
+        {"msgs": ["All of items must be unique."]},
+        *(
+            {"msgs": ["Duplicate of the item at index %d." % first], "loc": [index]}
+            for index, first in duplicates.items()
+        ),
+    ]
+
+    with schema.fail_fast_context():
+        with pytest.raises(schema.ValidationError) as e:
+            s.deserialize(data)
+        assert len(e.value.format_errors()) == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs, value, message",
+    [
+        (
+            dict(minimum=1, maximum=3),
+            4,
+            "The value must be greater than or equal to 1 and less than or equal to 3.",
+        ),
+        (
+            dict(minimum=1, maximum=3, exclusive_minimum=True),
+            1,
+            "The value must be greater than 1 and less than or equal to 3.",
+        ),
+        (
+            dict(minimum=1, maximum=3, exclusive_maximum=True),
+            3,
+            "The value must be greater than or equal to 1 and less than or equal to 3.",
+        ),
+        (
+            dict(minimum=1, maximum=3, exclusive_minimum=True, exclusive_maximum=True),
+            3,
+            "The value must be greater than 1 and less than 3.",
+        ),
+        (dict(minimum=1), 0, "The value must be greater than or equal to 1."),
+        (
+            dict(minimum=1, exclusive_minimum=True),
+            1,
+            "The value must be greater than 1.",
+        ),
+        (dict(maximum=3), 4, "The value must be less than or equal to 3."),
+        (dict(maximum=3, exclusive_maximum=True), 3, "The value must be less than 3"),
+    ],
+)
+def test_range_validation(kwargs, value, message):
+    with pytest.raises(schema.ValidationError) as e:
+        schema.Integer(**kwargs).deserialize(value)
+    assert e.value.format_errors() == [{"msgs": [message]}]
+
+
+@pytest.mark.parametrize(
+    "kwargs, value, message",
+    [
+        (
+            dict(min_length=1, max_length=2),
+            "abc",
+            "The length must be between 1 and 2.",
+        ),
+        (dict(min_length=2), "a", "The length must be greater than or equal to 2."),
+        (dict(max_length=2), "abc", "The length must be less than or equal to 2."),
+    ],
+)
+def test_length_validation(kwargs, value, message):
+    assert schema.String(**kwargs).deserialize(value[:1] * 2) == value[:1] * 2
+    with pytest.raises(schema.ValidationError) as e:
+        schema.String(**kwargs).deserialize(value)
+    assert e.value.format_errors() == [{"msgs": [message]}]
+
+
+@pytest.mark.parametrize(
+    "schemaobj, valid, invalid",
+    [
+        (schema.Integer(multiple_of=3), [0, -3, 9.0, 3 * 10**15], [1, 10**15]),
+        (schema.Float(multiple_of=3), [0, -3, 9.0], [1, 9.5]),
+        (schema.Float(multiple_of=0.1), [0, 3, 0.3, 1e20], [0.05, 0.1 + 0.2]),
+        (schema.Float(multiple_of=2.5), [5, 7.5, -2.5], [1, 2.6]),
+        (schema.Float(multiple_of=0.25), [0.75, -1.25, 1.5e-00], [0.3, 1.5e-07]),
+        (schema.Float(multiple_of=0.001), [1.234, 1e-03], [1.2345, 1.5e-07]),
+        # 2**53 以上以 str() 的十进制值计算，而不是浮点数的二进制值
+        (
+            schema.Float(multiple_of=10),
+            [2.0**53 + 2 - 4, 1e23, 1e300],
+            [2.0**53, 2.0**53 + 2],
+        ),
+        (schema.Float(multiple_of=3), [3e23, 3.0 * 2**52], [1e23]),
+    ],
+)
+def test_multiple_of(schemaobj, valid, invalid):
+    for value in valid:
+        assert schemaobj.deserialize(value) == value
+    for value in invalid:
+        with pytest.raises(schema.ValidationError) as e:
+            schemaobj.deserialize(value)
+        assert e.value.format_errors() == [
+            {"msgs": ["The value must be a multiple of %s." % schemaobj._multiple_of]}
+        ]
+
+
+def test_choices():
+    s = schema.Any(choices=["a", 1, [1, 2], {3}])
+    for value in ("a", 1, 1.0, True, [1, 2], frozenset({3})):
+        assert s.deserialize(value) == value
+
+    for value in ("b", 2, [1], {"a": 1}):
+        with pytest.raises(schema.ValidationError) as e:
+            s.deserialize(value)
+        assert e.value.format_errors() == [
+            {"msgs": ["The value must be one of 'a', 1, [1, 2], {3}."]}
+        ]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2022-01-01",
+        "2022-01-01T08:12",
+        "2022-01-01 08:12:30.5",
+        "2022-01-01T08:12:30.123456789Z",
+        "2022-01-01T08:12:30,25+07",
+        "2022-01-01T08:12:30-0530",
+        "2022-01-01T24:00",
+        "2022-01-01T08:12:30z",
+        "2022-01-01T08:12+23:59",
+        "20220101T0812",
+        "2022-W01-1",
+    ],
+)
+def test_Datetime__parse_isoformat(value):
+    from dateutil.parser import isoparse
+
+    expected = isoparse(value)
+    result = schema.Datetime().deserialize(value)
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+    assert schema.Date().deserialize(value) == expected.date()
+
+    # Python 3.11 以前使用的构建方式
+    from django_oasis_schema.schemas import _ISO_DATETIME, _build_datetime
+
+    match = _ISO_DATETIME.fullmatch(value)
+    if match is not None:
+        result = _build_datetime(match)
+        assert result == expected
+        assert result.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "value", ["2022-01-01T24:00", "2022-01-01T08:12z", "2022-01-01T08:12+05:60"]
+)
+def test_Datetime__parse_isoformat_fallback(value):
+    # 超出范围的值及小写的 z 不由正则表达式匹配，交由 isoparse 处理
+    from django_oasis_schema.schemas import _ISO_DATETIME
+
+    assert _ISO_DATETIME.fullmatch(value) is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2022-02-30",
+        "2022-01-01T25:00",
+        "2022-01-01T08:60",
+        "2022-01-01T08:12:60",
+        "2022-01-01T08:12+05:60",
+        "2022-01-01T08:12+24:00",
+        "x",
+    ],
+)
+def test_Datetime__parse_isoformat_error(value):
+    with pytest.raises(schema.ValidationError):
+        schema.Datetime().deserialize(value)
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import StreamingHttpResponse
+from samples.pagination.models import Book
+
+from django_oasis import schema
+from django_oasis.core import Operation, Resource
+
+
+class BookSchema(schema.Model):
+    title = schema.String()
+
+
+@pytest.mark.django_db
+def test_streaming_response(rf, get_view):
+    Book.objects.bulk_create([Book(title=str(i), author="老刘") for i in range(5)])
+
+    @Resource("/")
+    class API:
+        @Operation(
+            response_schema=schema.List(BookSchema), stream=True, stream_chunk_size=2
+        )
+        def get(self):
+            return Book.objects.order_by("pk")
+
+    response = get_view(API)(rf.get("/"))
+    assert isinstance(response, StreamingHttpResponse)
+    assert response["Content-Type"] == "application/json"
+    chunks = list(response.streaming_content)
+    assert len(chunks) == 3
+    assert json.loads(b"".join(chunks)) == [{"title": str(i)} for i in range(5)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_streaming_response(rf, get_view):
+    Book.objects.bulk_create([Book(title=str(i), author="老刘") for i in range(3)])
+
+    @Resource("/")
+    class API:
+        @Operation(response_schema=schema.List(BookSchema), stream=True)
+        async def get(self):
+            return Book.objects.order_by("pk")
+
+    response = async_to_sync(get_view(API))(rf.get("/"))
+    assert response.is_async
+
+    async def read():
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    assert json.loads(async_to_sync(read)()) == [{"title": str(i)} for i in range(3)]
+
+
+def test_sync_streaming_response_asgi(async_rf, get_view):
+    consumed = []
+
+    def generate():
+        for i in range(6):
+            consumed.append(i)
+            yield i
+
+    @Resource("/")
+    class API:
+        @Operation(
+            response_schema=schema.List(schema.Integer()),
+            stream=True,
+            stream_chunk_size=2,
+        )
+        def get(self):
+            return generate()
+
+    # ASGI 下同步视图的流式响应也是异步迭代的，数据逐块生成
+    response = get_view(API)(async_rf.get("/"))
+    assert response.is_async
+
+    async def read():
+        chunks = []
+        async for chunk in response.streaming_content:
+            chunks.append((chunk, len(consumed)))
+        return chunks
+
+    assert async_to_sync(read)() == [
+        (b"[0,1", 2),
+        (b",2,3", 4),
+        (b",4,5", 6),
+        (b"]", 6),
+    ]
+
+
+def test_streaming_empty(rf, get_view):
+    @Resource("/")
+    class API:
+        @Operation(response_schema=schema.List(schema.Integer()), stream=True)
+        def get(self):
+            return iter([])
+
+    response = get_view(API)(rf.get("/"))
+    assert b"".join(response.streaming_content) == b"[]"
+
+
+def test_streaming_requires_list():
+    with pytest.raises(ValueError):
+
+        @Operation(response_schema=BookSchema, stream=True)
+        def get(): ...